@@ -26,7 +26,13 @@ from .frame_manager import Frame, FrameManager
 from .frame_resource_tree import FrameResource, FrameResourceTree
 from .input import Keyboard, Mouse, Touchscreen
 from .jsHandle import ElementHandle, JSHandle
-from .launcher import Launcher, connect, launch
+from .launcher import (
+    BrowserPool,
+    Launcher,
+    connect,
+    launch,
+    reap_orphaned_user_data_dirs,
+)
 from .lifecycle_watcher import LifecycleWatcher
 from .log import Log, LogEntry
 from .network_idle_monitor import NetworkIdleMonitor
@@ -45,6 +51,7 @@ __all__ = [
     "BrowserError",
     "BrowserFetcher",
     "BrowserFetcherError",
+    "BrowserPool",
     "CDPSession",
     "Chrome",
     "ClientType",
@@ -81,6 +88,7 @@ __all__ = [
     "NetworkManager",
     "Page",
     "PageError",
+    "reap_orphaned_user_data_dirs",
     "Request",
     "Response",
     "RevisionInfo",
@@ -130,8 +130,10 @@ class BrowserFetcher:
         folder_path.mkdir(parents=True)
         try:
             await download_revision(url, revision, zip_path, loop=loop)
-            with ZipFile(zip_path) as zf:
-                zf.extractall(path=folder_path)
+            # extracting chromium takes seconds, keep the loop responsive meanwhile
+            await Helper.ensure_loop(loop).run_in_executor(
+                None, extract_zip, zip_path, folder_path
+            )
         finally:
             if zip_path.exists():
                 zip_path.unlink()
@@ -227,6 +229,11 @@ def get_progress_bar(revision: str, total_length: int) -> Optional[tqdm]:
     )
 
 
+def extract_zip(zip_path: Path, folder_path: Path) -> None:
+    with ZipFile(zip_path) as zf:
+        zf.extractall(path=folder_path)
+
+
 async def download_revision(
     url: str, revision: str, zip_path: Path, loop: Optional[AbstractEventLoop] = None
 ) -> None:
@@ -1,7 +1,7 @@
 from asyncio import Future
 from inspect import isawaitable
-from subprocess import Popen
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+from asyncio.subprocess import Process
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
 
 from pyee2 import EventEmitterS
 
@@ -34,10 +34,10 @@ class Chrome(EventEmitterS):
     @staticmethod
     async def create(
         connection: ClientType,
-        contextIds: List[str],
+        contextIds: Sequence[str],
         ignoreHTTPSErrors: bool,
         defaultViewport: Optional[Dict[str, int]] = None,
-        process: Optional[Popen] = None,
+        process: Optional[Process] = None,
         closeCallback: Optional[Callable[[], Any]] = None,
         targetInfo: Optional[Dict] = None,
         loop: OptionalLoop = None,
@@ -58,17 +58,17 @@ class Chrome(EventEmitterS):
     def __init__(
         self,
         connection: ClientType,
-        contextIds: List[str],
+        contextIds: Sequence[str],
         ignoreHTTPSErrors: bool,
         defaultViewport: Optional[Dict[str, int]] = None,
-        process: Optional[Popen] = None,
+        process: Optional[Process] = None,
         closeCallback: Optional[Callable[[], Any]] = None,
         targetInfo: Optional[Dict] = None,
         loop: OptionalLoop = None,
     ) -> None:
         super().__init__(loop=Helper.ensure_loop(loop))
         self._ignoreHTTPSErrors: bool = ignoreHTTPSErrors
-        self._process: Optional[Popen] = process
+        self._process: Optional[Process] = process
         self._defaultViewport: Optional[Dict[str, int]] = defaultViewport
         self._screenshotTaskQueue: List = []
         self._connection: ClientType = connection
@@ -99,7 +99,7 @@ class Chrome(EventEmitterS):
         self._connection.on("Target.targetInfoChanged", self._targetInfoChanged)
 
     @property
-    def process(self) -> Optional[Popen]:
+    def process(self) -> Optional[Process]:
         return self._process
 
     @property
@@ -155,7 +155,7 @@ class DOMWorld:
     ) -> List[Any]:
         document = await self.document()
         value = await document.querySelectorAllEval(
-            selector, pageFunction, *args, withCliAPI
+            selector, pageFunction, *args, withCliAPI=withCliAPI
         )
         return value
 
@@ -184,8 +184,7 @@ class DOMWorld:
         )
 
         done, pending = await Helper.wait_for_first_done(
-            watcher.timeoutPromise,
-            watcher.terminationPromise,
+            watcher.timeoutOrTerminationPromise,
             watcher.lifecyclePromise,
             loop=self._loop,
         )
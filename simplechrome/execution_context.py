@@ -1,6 +1,7 @@
 """ExecutionContext Context Module."""
 import re
-from typing import Any, Dict, Optional, Pattern, TYPE_CHECKING
+from asyncio import Task
+from typing import Any, Dict, List, Optional, Pattern, Set, TYPE_CHECKING, Tuple
 
 import math
 
@@ -29,8 +30,11 @@ class ExecutionContext:
         "_client",
         "_contextPayload",
         "_world",
+        "_frame",
         "_contextId",
         "_isDefault",
+        "_pendingReleases",
+        "_elementHelpersInstalled",
     ]
 
     def __init__(
@@ -39,10 +43,15 @@ class ExecutionContext:
         self._client: ClientType = client
         self._contextPayload: Dict = contextPayload
         self._world: Optional[DOMWorld] = world
+        # a world never changes frame, resolve it once for createJSHandle
+        self._frame: Optional["Frame"] = world.frame if world is not None else None
         self._contextId: str = self._contextPayload.get("id")
         self._isDefault: bool = self._contextPayload.get("auxData", {}).get(
             "isDefault", False
         )
+        self._pendingReleases: Set[Task] = set()
+        # set once ElementHandle has installed its helpers in this context
+        self._elementHelpersInstalled: bool = False
 
     @property
     def default(self) -> bool:
@@ -54,7 +63,7 @@ class ExecutionContext:
 
     @property
     def frame(self) -> Optional["Frame"]:
-        return self._world.frame if self._world is not None else None
+        return self._frame
 
     async def evaluate(
         self, pageFunction: str, *args: Any, withCliAPI: bool = False
@@ -109,13 +118,28 @@ class ExecutionContext:
             remoteObject = _obj.get("result")
             return createJSHandle(self, remoteObject)
 
+        remoteObject = await self._callFunctionOn(pageFunction, args, False)
+        return createJSHandle(self, remoteObject)
+
+    async def _evaluateByValue(self, pageFunction: str, *args: Any) -> Any:
+        """Call ``pageFunction`` and return its JSON serializable result.
+
+        Unlike :meth:`evaluate` this is a single ``Runtime.callFunctionOn``, no
+        handle is created for the result so there is nothing to release.
+        """
+        remoteObject = await self._callFunctionOn(pageFunction, args, True)
+        return Helper.valueFromRemoteObject(remoteObject)
+
+    async def _callFunctionOn(
+        self, pageFunction: str, args: Tuple[Any, ...], returnByValue: bool
+    ) -> Dict:
         _obj = await self._client.send(
             "Runtime.callFunctionOn",
             {
                 "functionDeclaration": f"{pageFunction}\n{suffix}\n",
                 "executionContextId": self._contextId,
                 "arguments": [self._convertArgument(arg) for arg in args],
-                "returnByValue": False,
+                "returnByValue": returnByValue,
                 "awaitPromise": True,
                 "userGesture": True,
             },
@@ -127,8 +151,30 @@ class ExecutionContext:
                     Helper.getExceptionMessage(exceptionDetails)
                 )
             )
-        remoteObject = _obj.get("result")
-        return createJSHandle(self, remoteObject)
+        return _obj.get("result")
+
+    async def _evaluateElementArray(
+        self, pageFunction: str, *args: Any
+    ) -> List["ElementHandle"]:
+        """Call ``pageFunction`` and return handles to the DOM nodes contained
+        in the array it returns.
+
+        The array handle is released in the background once its properties
+        have been read, or failed to be.
+        """
+        arrayHandle = await self.evaluateHandle(pageFunction, *args)
+        try:
+            response = await self._client.send(
+                "Runtime.getProperties",
+                {"objectId": arrayHandle._objectId, "ownProperties": True},
+            )
+        finally:
+            self._disposeInBackground(arrayHandle)
+        return [
+            createJSHandle(self, prop["value"])
+            for prop in response["result"]
+            if "value" in prop and prop["value"].get("subtype") == "node"
+        ]
 
     async def evaluate_expression(
         self, expression: str, withCliAPI: bool = False
@@ -160,16 +206,35 @@ class ExecutionContext:
         """
         if prototypeHandle._disposed:
             raise Exception("Prototype JSHandle is disposed!")
-        if not prototypeHandle._remoteObject.get("objectId"):
+        if not prototypeHandle._objectId:
             raise Exception(
                 "Prototype JSHandle must not be referencing primitive value"
             )
         response = await self._client.send(
             "Runtime.queryObjects",
-            {"prototypeObjectId": prototypeHandle._remoteObject["objectId"]},
+            {"prototypeObjectId": prototypeHandle._objectId},
         )
         return createJSHandle(self, response.get("objects"))
 
+    def _disposeInBackground(self, handle: "JSHandle") -> None:
+        """Dispose of ``handle`` without waiting for its remote object release."""
+        if handle._objectId is None:
+            handle._disposed = True
+            return
+        self._trackRelease(self._client.loop.create_task(handle.dispose()))
+
+    def _trackRelease(self, task: Task) -> None:
+        self._pendingReleases.add(task)
+        task.add_done_callback(self._pendingReleases.discard)
+
+    def _cancelPendingReleases(self) -> None:
+        """Cancel the in-flight background disposals, their remote objects
+        are released along with this context by the browser.
+        """
+        for task in self._pendingReleases:
+            task.cancel()
+        self._pendingReleases.clear()
+
     def _convertArgument(self, arg: Any) -> Dict:  # noqa: C901
         if arg == -0:
             return {"unserializableValue": "-0"}
@@ -191,9 +256,9 @@ class ExecutionContext:
                         "unserializableValue"
                     )
                 }  # noqa: E501
-            if not objectHandle._remoteObject.get("objectId"):
+            if not objectHandle._objectId:
                 return {"value": objectHandle._remoteObject.get("value")}
-            return {"objectId": objectHandle._remoteObject.get("objectId")}
+            return {"objectId": objectHandle._objectId}
         return {"value": arg}
 
     async def _adoptElementHandle(self, elementHandle: ElementHandle) -> ElementHandle:
@@ -202,7 +267,7 @@ class ExecutionContext:
                 "Cannot adopt handle that already belongs to this execution context"
             )
         nodeInfo = await self._client.send(
-            "DOM.describeNode", {"objectId": elementHandle._remoteObject["objectId"]}
+            "DOM.describeNode", {"objectId": elementHandle._objectId}
         )
 
         resolvedNode = await self._client.send(
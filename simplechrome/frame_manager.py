@@ -222,14 +222,11 @@ class FrameManager(EventEmitterS):
 
         ensureNewDocumentNavigation = {"ensure": False}
 
-        # asyncio.wait does not work like Promise.race
-        # if we were to use watcher.timeoutOrTerminationPromise and there was an error
-        # done would be a task with a result that is a tuple (Task-That-Failed, future still pending)
-        # requiring two result calls :(
+        # asyncio.wait does not work like Promise.race, the first done future
+        # (navigation task or the watcher's timeout/termination) holds the error if any
         done, pending = await Helper.wait_for_first_done(
             self.__navigate(ensureNewDocumentNavigation, nav_args, url, watcher),
-            watcher.timeoutPromise,
-            watcher.terminationPromise,
+            watcher.timeoutOrTerminationPromise,
             loop=self._loop,
         )
         error = done.pop().result()
@@ -240,8 +237,7 @@ class FrameManager(EventEmitterS):
                 final_prom = watcher.sameDocumentNavigationPromise
 
             done, pending = await Helper.wait_for_first_done(
-                watcher.timeoutPromise,
-                watcher.terminationPromise,
+                watcher.timeoutOrTerminationPromise,
                 final_prom,
                 loop=self._loop,
             )
@@ -287,8 +283,7 @@ class FrameManager(EventEmitterS):
             self, frame, waitUnitl, timeout, all_frames, self._loop
         )
         done, pending = await Helper.wait_for_first_done(
-            watcher.timeoutPromise,
-            watcher.terminationPromise,
+            watcher.timeoutOrTerminationPromise,
             watcher.sameDocumentNavigationPromise,
             watcher.newDocumentNavigationPromise,
             loop=self._loop,
@@ -432,11 +427,13 @@ class FrameManager(EventEmitterS):
         if not context:
             return
         del self._contextIdToContext[executionContextId]
+        context._cancelPendingReleases()
         if context._world:
             context._world._setContext(None)
 
     def _onExecutionContextsCleared(self, *args: Any) -> None:
         for context in self._contextIdToContext.values():
+            context._cancelPendingReleases()
             if context._world:
                 context._world._setContext(None)
         self._contextIdToContext.clear()
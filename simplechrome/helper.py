@@ -1,5 +1,6 @@
 """Helper functions."""
 from asyncio import FIRST_COMPLETED, Future, TimeoutError, get_event_loop, wait
+from types import MappingProxyType
 from typing import (
     Any,
     Awaitable,
@@ -7,6 +8,7 @@ from typing import (
     Coroutine,
     Dict,
     List,
+    Mapping,
     Optional,
     Set,
     Tuple,
@@ -24,7 +26,10 @@ from ._typings import FutureOrTask, Loop, Number, OptionalLoop, OptionalNumber
 from .connection import ClientType
 from .errors import ElementHandleError, WaitTimeoutError
 
-__all__ = ["Helper", "unserializableValueMap", "EEListener"]
+__all__ = ["Helper", "unserializableValueMap", "EEListener", "EMPTY_OPTIONS"]
+
+#: Shared read-only options used when a method is called without any options
+EMPTY_OPTIONS: Mapping[str, Any] = MappingProxyType({})
 
 unserializableValueMap = {
     "-0": -0,
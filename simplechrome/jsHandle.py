@@ -1,31 +1,38 @@
-import copy
 import os
 from asyncio import gather
-from typing import Any, Awaitable, Dict, List, Optional, TYPE_CHECKING, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    TYPE_CHECKING,
+    Tuple,
+    Union,
+)
 
 import math
 
 from ._typings import Number, SlotsT
 from .connection import ClientType
-from .helper import Helper
+from .errors import EvaluationError
+from .helper import EMPTY_OPTIONS, Helper
 
 if TYPE_CHECKING:
     from .execution_context import ExecutionContext  # noqa: F401
     from .frame_manager import FrameManager, Frame  # noqa: F401
     from .page import Page  # noqa: F401
 
-__all__ = ["JSHandle", "ElementHandle", "createJSHandle"]
+__all__ = ["JSHandle", "ElementHandle", "createJSHandle", "ELEMENT_HELPERS_SCRIPT"]
 
 
 def createJSHandle(
     context: "ExecutionContext", remoteObject: Dict
 ) -> Union["ElementHandle", "JSHandle"]:
-    frame = context.frame
-    if remoteObject.get("subtype") == "node" and frame:
-        frameManager = frame._frameManager
-        return ElementHandle(
-            context, context._client, remoteObject, frameManager.page, frameManager
-        )
+    if remoteObject.get("subtype") == "node" and context._frame is not None:
+        return ElementHandle(context, context._client, remoteObject)
     return JSHandle(context, context._client, remoteObject)
 
 
@@ -34,8 +41,11 @@ class JSHandle:
         "__weakref__",
         "_context",
         "_client",
+        "_send",
         "_remoteObject",
         "_disposed",
+        "_objectId",
+        "_strCache",
     ]
 
     @classmethod
@@ -47,8 +57,11 @@ class JSHandle:
     ) -> None:
         self._context = context
         self._client = client
+        self._send: Callable[..., Awaitable[Dict]] = client.send
         self._remoteObject = remoteObject
+        self._objectId: Optional[str] = remoteObject.get("objectId")
         self._disposed = False
+        self._strCache: Optional[str] = None
 
     @property
     def executionContext(self) -> "ExecutionContext":
@@ -63,43 +76,52 @@ class JSHandle:
 
     def toString(self) -> str:
         """Get string representation."""
-        if self._remoteObject.get("objectId"):
-            sub_type = self._remoteObject.get("subtype")
-            if sub_type == "node":
-                _type = f"{self._remoteObject.get('className')}-{self._remoteObject.get('description')}"
-            else:
-                _type = sub_type or self._remoteObject.get("type")
-            return f"{self.__class__.__name__}@{_type}"
-        return f"{self.__class__.__name__}:{Helper.valueFromRemoteObject(self._remoteObject)}"
+        if self._strCache is None:
+            self._strCache = self._toString()
+        return self._strCache
+
+    def _toString(self) -> str:
+        remoteObject = self._remoteObject
+        className = type(self).__name__
+        if not self._objectId:
+            return f"{className}:{Helper.valueFromRemoteObject(remoteObject)}"
+        subtype = remoteObject.get("subtype")
+        if subtype == "node":
+            return f"{className}@{remoteObject.get('className')}-{remoteObject.get('description')}"
+        return f"{className}@{subtype or remoteObject.get('type')}"
 
     async def getProperty(
         self, propertyName: str
     ) -> Union["JSHandle", "ElementHandle"]:
         """Get property value of ``propertyName``."""
-        objectHandle = await self._context.evaluateHandle(
-            """(object, propertyName) => {
-                const result = {__proto__: null};
-                result[propertyName] = object[propertyName];
-                return result;
-            }""",
-            self,
-            propertyName,
-        )
-        properties = await objectHandle.getProperties()
-        result = properties[propertyName]
-        await objectHandle.dispose()
-        return result
+        if not self._objectId:
+            # primitive values have no remote object to call the getter on
+            objectHandle = await self._context.evaluateHandle(
+                GET_PROPERTY_JS, self, propertyName
+            )
+            properties = await objectHandle.getProperties()
+            self._context._disposeInBackground(objectHandle)
+            return properties[propertyName]
+        remoteObject = await self._callPropertyGetter(propertyName, False)
+        return createJSHandle(self._context, remoteObject)
+
+    async def getPropertyValue(self, propertyName: str) -> Any:
+        """Get the JSON value of the property ``propertyName``."""
+        if not self._objectId:
+            handle = await self.getProperty(propertyName)
+            return await handle.jsonValue()
+        remoteObject = await self._callPropertyGetter(propertyName, True)
+        return Helper.valueFromRemoteObject(remoteObject)
 
     async def getProperties(self) -> Dict[str, Union["JSHandle", "ElementHandle"]]:
         """Get all properties of this handle."""
         properties = await self._properties()
-        result = {}
         context = self._context
-        for prop in properties["result"]:
-            if not prop.get("enumerable"):
-                continue
-            result[prop.get("name")] = createJSHandle(context, prop.get("value"))
-        return result
+        return {
+            prop["name"]: createJSHandle(context, prop["value"])
+            for prop in properties["result"]
+            if prop["enumerable"]
+        }
 
     async def asArray(self) -> List["JSHandle"]:
         properties = await self._properties()
@@ -111,12 +133,12 @@ class JSHandle:
 
     async def jsonValue(self) -> Any:
         """Get Jsonized value of this object."""
-        objectId = self._remoteObject.get("objectId")
+        objectId = self._objectId
         if objectId:
-            response = await self._client.send(
+            response = await self._send(
                 "Runtime.callFunctionOn",
                 {
-                    "functionDeclaration": "function() { return this; }",
+                    "functionDeclaration": JSON_VALUE_JS,
                     "objectId": objectId,
                     "returnByValue": True,
                     "awaitPromise": True,
@@ -130,35 +152,55 @@ class JSHandle:
         if self._disposed:
             return
         self._disposed = True
+        if self._objectId is None:
+            # primitive values are not held by the browser
+            return
         await Helper.releaseObject(self._client, self._remoteObject)
 
+    async def _callPropertyGetter(self, propertyName: str, returnByValue: bool) -> Dict:
+        response = await self._send(
+            "Runtime.callFunctionOn",
+            {
+                "functionDeclaration": GET_PROPERTY_OF_THIS_JS,
+                "objectId": self._objectId,
+                "arguments": [{"value": propertyName}],
+                "returnByValue": returnByValue,
+            },
+        )
+        exceptionDetails = response.get("exceptionDetails")
+        if exceptionDetails:
+            raise EvaluationError(
+                "Evaluation failed: {}".format(
+                    Helper.getExceptionMessage(exceptionDetails)
+                )
+            )
+        return response["result"]
+
     def _properties(self) -> Awaitable[Dict]:
-        return self._client.send(
+        return self._send(
             "Runtime.getProperties",
-            {"objectId": self._remoteObject.get("objectId", ""), "ownProperties": True},
+            {"objectId": self._objectId or "", "ownProperties": True},
         )
 
     def _handle_list(self, properties: Dict) -> List["JSHandle"]:
-        handle_list: List[JSHandle] = []
-        add_handle = handle_list.append
         context = self._context
-        for prop in properties["result"]:
-            if not prop.get("enumerable"):
-                continue
-            remote_obj = prop.get("value")
-            add_handle(createJSHandle(context, remote_obj))
-        return handle_list
+        return [
+            createJSHandle(context, prop["value"])
+            for prop in properties["result"]
+            if prop["enumerable"]
+        ]
 
     def _element_list(self, properties: Dict) -> List["ElementHandle"]:
-        handle_list: List[ElementHandle] = []
-        add_handle = handle_list.append
         context = self._context
-        for prop in properties["result"]:
-            if not prop.get("enumerable"):
-                continue
-            remote_obj = prop.get("value")
-            add_handle(createJSHandle(context, remote_obj).asElement())
-        return handle_list
+        return [
+            element
+            for element in (
+                createJSHandle(context, prop["value"]).asElement()
+                for prop in properties["result"]
+                if prop["enumerable"]
+            )
+            if element is not None
+        ]
 
     def __str__(self) -> str:
         return self.toString()
@@ -168,84 +210,62 @@ class JSHandle:
 
 
 class ElementHandle(JSHandle):
-    __slots__: SlotsT = ["_frameManager", "_page"]
+    __slots__: SlotsT = ["_contentFrameCache"]
 
     def __init__(
-        self,
-        context: "ExecutionContext",
-        client: ClientType,
-        remoteObject: Dict,
-        page: "Page",
-        frameManager: "FrameManager",
+        self, context: "ExecutionContext", client: ClientType, remoteObject: Dict
     ) -> None:
         super().__init__(context, client, remoteObject)
-        self._page: Optional["Page"] = page
-        self._frameManager: "FrameManager" = frameManager
+        assert self._objectId, "ElementHandle requires a remote object"
+        self._contentFrameCache: Optional["Frame"] = None
+
+    @property
+    def _frameManager(self) -> "FrameManager":
+        # element handles are only created for contexts that have a frame
+        return self._context._frame._frameManager
+
+    @property
+    def _page(self) -> Optional["Page"]:
+        return self._context._frame._frameManager.page
+
+    async def dispose(self) -> None:
+        self._contentFrameCache = None
+        await super().dispose()
 
     def isIntersectingViewport(self) -> Awaitable[bool]:
-        return self.executionContext.evaluate(
-            """async element => {
-        const visibleRatio = await new Promise(resolve => {
-        const observer = new IntersectionObserver(entries => {
-          resolve(entries[0].intersectionRatio);
-          observer.disconnect();
-        });
-        observer.observe(element);
-      });
-      return visibleRatio > 0;
-    }""",
-            self,
-        )
+        return self._callHelper("isInViewport")
 
     def innerText(self, text: Optional[str] = None) -> Awaitable[str]:
-        return self.executionContext.evaluate(
-            """(element, newValue) => {
-          if (newValue) element.innerText = newValue;
-          return element.innerText;
-        }""",
-            self,
-            text,
-        )
+        return self.executionContext.evaluate(INNER_TEXT_JS, self, text)
 
     def innerHTML(self, html: Optional[str] = None) -> Awaitable[str]:
-        return self.executionContext.evaluate(
-            """(element, newValue) => {
-          if (newValue) element.innerHTML = newValue;
-          return element.innerHTML;
-        }""",
-            self,
-            html,
-        )
+        return self.executionContext.evaluate(INNER_HTML_JS, self, html)
 
     def outerHTML(self, html: Optional[str] = None) -> Awaitable[str]:
-        return self.executionContext.evaluate(
-            """(element, newValue) => {
-          if (newValue) element.outerHTML = newValue;
-          return element.outerHTML;
-        }""",
-            self,
-            html,
-        )
+        return self.executionContext.evaluate(OUTER_HTML_JS, self, html)
 
     def hasChildNodes(self) -> Awaitable[bool]:
-        return self.executionContext.evaluate("elem => elem.hasChildNodes()", self)
+        return self.executionContext.evaluate(HAS_CHILD_NODES_JS, self)
 
     def childElementCount(self) -> Awaitable[Number]:
-        return self.executionContext.evaluate("elem => elem.childElementCount", self)
+        return self.executionContext.evaluate(CHILD_ELEMENT_COUNT_JS, self)
 
     def getAttribute(self, attr: str) -> Awaitable[Any]:
-        return self.executionContext.evaluate(
-            """(element, attr) => element.getAttribute(attr)""", self, attr
-        )
+        return self.executionContext.evaluate(GET_ATTRIBUTE_JS, self, attr)
 
     async def contentFrame(self) -> Optional["Frame"]:
-        nodeInfo = await self._client.send(
-            "DOM.describeNode", {"objectId": self._remoteObject.get("objectId")}
+        cached = self._contentFrameCache
+        # a removed or re-navigated iframe detaches the frame, ask again
+        if cached is not None and not cached._detached:
+            return cached
+        nodeInfo = await self._send(
+            "DOM.describeNode", {"objectId": self._objectId}
         )
-        frameId = nodeInfo.get("node", {}).get("frameId")
+        frameId = nodeInfo["node"].get("frameId")
         if frameId is None:
             return None
-        return self._frameManager.frame(frameId)
+        self._contentFrameCache = self._frameManager.frame(frameId)
+        return self._contentFrameCache
 
     async def hover(self) -> None:
         """Move mouse over to center of this element.
@@ -253,10 +273,9 @@ class ElementHandle(JSHandle):
         If needed, this method scrolls eleemnt into view. If this element is
         detached from DOM tree, the method raises an ``ElementHandleError``.
         """
-        await self._scrollIntoViewIfNeeded()
-        obj = await self._clickablePoint()
-        x = obj.get("x", 0)
-        y = obj.get("y", 0)
+        obj = await self._scrollIntoViewAndGetClickablePoint()
+        x = obj["x"]
+        y = obj["y"]
         await self._page.mouse.move(x, y)
 
     async def click(
@@ -271,17 +290,21 @@ class ElementHandle(JSHandle):
         :param clickCount: defaults to 1
         :param delay: Time to wait between ``mousedown`` and ``mouseup`` in milliseconds. Defaults to 0.
         """
-        await self._scrollIntoViewIfNeeded()
-        obj = await self._clickablePoint()
-        x = obj.get("x", 0)
-        y = obj.get("y", 0)
+        obj = await self._scrollIntoViewAndGetClickablePoint()
+        x = obj["x"]
+        y = obj["y"]
         await self._page.mouse.click(x, y, button, clickCount, delay)
 
     async def uploadFile(self, *filePaths: str) -> None:
         """Upload files."""
-        files = [os.path.abspath(p) for p in filePaths]
-        objectId = self._remoteObject.get("objectId")
-        await self._client.send(
+        isabs = os.path.isabs
+        if all(isabs(p) for p in filePaths):
+            files = [os.path.normpath(p) for p in filePaths]
+        else:
+            cwd = os.getcwd()
+            files = [os.path.normpath(os.path.join(cwd, p)) for p in filePaths]
+        objectId = self._objectId
+        await self._send(
             "DOM.setFileInputFiles", {"objectId": objectId, "files": files}
         )
 
@@ -291,15 +314,14 @@ class ElementHandle(JSHandle):
         If needed, this method scrolls element into view. If the element is
         detached from DOM, the method raises ``ElementHandleError``.
         """
-        await self._scrollIntoViewIfNeeded()
-        center = await self._clickablePoint()
-        x = center.get("x", 0)
-        y = center.get("y", 0)
+        center = await self._scrollIntoViewAndGetClickablePoint()
+        x = center["x"]
+        y = center["y"]
         await self._page.touchscreen.tap(x, y)
 
     async def focus(self) -> None:
         """Focus on this element."""
-        await self.executionContext.evaluate("element => element.focus()", self)
+        await self.executionContext.evaluate(FOCUS_JS, self)
 
     async def type(self, text: str, delay: Number = 0) -> None:
         """Type characters.
@@ -351,10 +373,12 @@ class ElementHandle(JSHandle):
             return None
 
         quad = result["model"]["border"]
-        x = min(quad[0], quad[2], quad[4], quad[6])
-        y = min(quad[1], quad[3], quad[5], quad[7])
-        width = max(quad[0], quad[2], quad[4], quad[6]) - x
-        height = max(quad[1], quad[3], quad[5], quad[7]) - y
+        xs = quad[0::2]
+        ys = quad[1::2]
+        x = min(xs)
+        y = min(ys)
+        width = max(xs) - x
+        height = max(ys) - y
         return {"x": x, "y": y, "width": width, "height": height}
 
     async def boxModel(
@@ -377,14 +401,14 @@ class ElementHandle(JSHandle):
         if not result:
             return None
 
-        model = result.get("model", {})
+        model = result["model"]
         return {
-            "content": fromProtocolQuad(model.get("content")),
-            "padding": fromProtocolQuad(model.get("padding")),
-            "border": fromProtocolQuad(model.get("border")),
-            "margin": fromProtocolQuad(model.get("margin")),
-            "width": model.get("width"),
-            "height": model.get("height"),
+            "content": fromProtocolQuad(model["content"]),
+            "padding": fromProtocolQuad(model["padding"]),
+            "border": fromProtocolQuad(model["border"]),
+            "margin": fromProtocolQuad(model["margin"]),
+            "width": model["width"],
+            "height": model["height"],
         }
 
     async def screenshot(self, options: Dict = None, **kwargs: Any) -> bytes:
@@ -395,43 +419,60 @@ class ElementHandle(JSHandle):
 
         Available options are same as :meth:`simplechrome.page.Page.screenshot`.
         """
-        options = Helper.merge_dict(options, kwargs)
+        opts: Mapping[str, Any] = (
+            EMPTY_OPTIONS
+            if options is None and not kwargs
+            else Helper.merge_dict(options, kwargs)
+        )
 
         needsViewportReset = False
-        boundingBox = await self.boundingBox()
-        original_viewport = copy.deepcopy(self._page.viewport)
+        geometry = await self._screenshotGeometry()
+        boundingBox = geometry if geometry is not None else await self.boundingBox()
+        # the viewport only holds primitive values so a shallow copy suffices
+        original_viewport = self._page.viewport.copy()
 
         if (
             boundingBox["width"] > original_viewport["width"]
             or boundingBox["height"] > original_viewport["height"]
         ):
-            newViewport = {
-                "width": max(
-                    original_viewport["width"], math.ceil(boundingBox["width"])
-                ),
+            ceil = math.ceil
+            new_viewport = {
+                **original_viewport,
+                "width": max(original_viewport["width"], ceil(boundingBox["width"])),
                 "height": max(
-                    original_viewport["height"], math.ceil(boundingBox["height"])
+                    original_viewport["height"], ceil(boundingBox["height"])
                 ),
             }
-            new_viewport = copy.deepcopy(original_viewport)
-            new_viewport.update(newViewport)
             await self._page.setViewport(new_viewport)
             needsViewportReset = True
 
         await self._scrollIntoViewIfNeeded()
 
-        boundingBox = await self.boundingBox()
-        _obj = await self._client.send("Page.getLayoutMetrics")
-        pageX = _obj["layoutViewport"]["pageX"]
-        pageY = _obj["layoutViewport"]["pageY"]
-
-        clip: Dict[str, float] = {}
-        clip.update(boundingBox)
-        clip["x"] = clip["x"] + pageX
-        clip["y"] = clip["y"] + pageY
-        opt = {"clip": clip}
-        opt.update(options)
-        imageData = await self._page.screenshot(opt)
+        geometry = await self._screenshotGeometry()
+        if geometry is not None:
+            boundingBox = geometry
+            pageX = geometry["pageX"]
+            pageY = geometry["pageY"]
+        else:
+            boundingBox = await self.boundingBox()
+            # fetched fresh, the scroll offsets change with any scroll
+            _obj = await self._send("Page.getLayoutMetrics")
+            pageX = _obj["layoutViewport"]["pageX"]
+            pageY = _obj["layoutViewport"]["pageY"]
+
+        clip: Dict[str, float] = {
+            "x": boundingBox["x"] + pageX,
+            "y": boundingBox["y"] + pageY,
+            "width": boundingBox["width"],
+            "height": boundingBox["height"],
+        }
+        if opts:
+            opt = {"clip": clip}
+            opt.update(opts)
+            imageData = await self._page.screenshot(opt)
+        else:
+            # the clip was computed above so there is nothing to validate
+            imageData = await self._page._screenshotTask("png", {"clip": clip})
 
         if needsViewportReset:
             await self._page.setViewport(original_viewport)
@@ -444,12 +485,12 @@ class ElementHandle(JSHandle):
         If no element mathes the ``selector``, returns ``None``.
         """
         handle = await self.executionContext.evaluateHandle(
-            "(element, selector) => element.querySelector(selector)", self, selector
+            QUERY_SELECTOR_JS, self, selector
         )
         element = handle.asElement()
         if element:
             return element
-        await handle.dispose()
+        self.executionContext._disposeInBackground(handle)
         return None
 
     async def querySelectorEval(
@@ -459,37 +500,50 @@ class ElementHandle(JSHandle):
 
         Details see :meth:`simplechrome.page.Page.querySelectorEval`.
         """
-        elementHandle = await self.querySelector(selector)
-        if elementHandle is None:
-            raise Exception(
-                f'Error: failed to find element matching selector "{selector}"'
+        context = self.executionContext
+        if withCliAPI or not Helper.is_jsfunc(pageFunction):
+            elementHandle = await self.querySelector(selector)
+            if elementHandle is None:
+                raise Exception(
+                    f'Error: failed to find element matching selector "{selector}"'
+                )
+            result = await context.evaluate(
+                pageFunction, elementHandle, *args, withCliAPI=withCliAPI
             )
-        result = await self.executionContext.evaluate(
-            pageFunction, elementHandle, *args, withCliAPI=withCliAPI
-        )
-        await elementHandle.dispose()
-        return result
+            context._disposeInBackground(elementHandle)
+            return result
+        # query and call pageFunction within a single evaluation
+        try:
+            return await context.evaluate(
+                querySelectorEvalJS(pageFunction), self, selector, *args
+            )
+        except EvaluationError as e:
+            if e.args[0] != _SELECTOR_NOT_FOUND_ERROR:
+                raise
+        raise Exception(f'Error: failed to find element matching selector "{selector}"')
 
     async def querySelectorAll(self, selector: str) -> List["ElementHandle"]:
-        arrayHandle = await self.executionContext.evaluateHandle(
-            "(element, selector) => Array.from(element.querySelectorAll(selector))",
-            self,
-            selector,
+        return await self.executionContext._evaluateElementArray(
+            QUERY_SELECTOR_ALL_JS, self, selector
         )
-        return await arrayHandle.asElementArray()
 
     async def querySelectorAllEval(
         self, selector: str, pageFunction: str, *args: Any, withCliAPI: bool = False
     ) -> List[Any]:
-        arrayHandle = await self.executionContext.evaluateHandle(
-            "(element, selector) => Array.from(element.querySelectorAll(selector))",
-            self,
-            selector,
-        )
-        result = await self.executionContext.evaluate(
-            pageFunction, arrayHandle, *args, withCliAPI=withCliAPI
+        context = self.executionContext
+        if withCliAPI or not Helper.is_jsfunc(pageFunction):
+            arrayHandle = await context.evaluateHandle(
+                QUERY_SELECTOR_ALL_JS, self, selector
+            )
+            result = await context.evaluate(
+                pageFunction, arrayHandle, *args, withCliAPI=withCliAPI
+            )
+            context._disposeInBackground(arrayHandle)
+            return result
+        # query and call pageFunction within a single evaluation
+        return await context.evaluate(
+            querySelectorAllEvalJS(pageFunction), self, selector, *args
         )
-        return result
 
     async def xpath(self, expression: str) -> List["ElementHandle"]:
         """Evaluate XPath expression relative to this elementHandle.
@@ -498,21 +552,9 @@ class ElementHandle(JSHandle):
 
         :arg str expression: XPath string to be evaluated.
         """
-        arrayHandle = await self.executionContext.evaluateHandle(
-            """(element, expression) => {
-                const document = element.ownerDocument || element;
-                const iterator = document.evaluate(expression, element, null, XPathResult.ORDERED_NODE_ITERATOR_TYPE);
-                const array = [];
-                let item;
-                while ((item = iterator.iterateNext()))
-                    array.push(item);
-                return array;
-
-            }""",
-            self,
-            expression,
+        return await self.executionContext._evaluateElementArray(
+            XPATH_JS, self, expression
         )
-        return await arrayHandle.asElementArray()
 
     #: alias to :meth:`xpath`
     Jx = xpath
@@ -525,78 +567,82 @@ class ElementHandle(JSHandle):
     #: alias to :meth:`querySelectorAllEval`
     JJeval = querySelectorAllEval
 
+    async def _callHelper(self, name: str, *args: Any) -> Any:
+        """Call the element helper ``name`` installed by :data:`ELEMENT_HELPERS_SCRIPT`.
+
+        The first call in an execution context installs the helpers, later
+        calls only send the short call unless the helpers went missing. The
+        helpers only return JSON values which are read by value, one
+        ``Runtime.callFunctionOn`` per call.
+        """
+        call, install = _HELPER_SOURCES[name]
+        context = self.executionContext
+        if context._elementHelpersInstalled:
+            result = await context._evaluateByValue(call, self, *args)
+            if result != _HELPERS_MISSING:
+                return result
+        result = await context._evaluateByValue(install, self, *args)
+        context._elementHelpersInstalled = True
+        return result
+
     async def _scrollIntoViewIfNeeded(self) -> None:
-        error = await self.executionContext.evaluate(
-            """async (element, pageJavascriptEnabled) => {
-                if (!element.isConnected)
-                    return 'Node is detached from document';
-                if (element.nodeType !== Node.ELEMENT_NODE)
-                    return 'Node is not of type HTMLElement';
-                // force-scroll if page's javascript is disabled.
-                if (!pageJavascriptEnabled) {
-                    element.scrollIntoView({block: 'center', inline: 'center', behavior: 'instant'});
-                    return false;
-                }
-                const visibleRatio = await new Promise(resolve => {
-                    const observer = new IntersectionObserver(entries => {
-                        resolve(entries[0].intersectionRatio);
-                        observer.disconnect();
-                    });
-                    observer.observe(element);
-                });
-                if (visibleRatio !== 1.0)
-                    element.scrollIntoView({block: 'center', inline: 'center', behavior: 'instant'});
-                return false;
-            }""",
-            self,
-            self._page._javascriptEnabled,
+        # the helper returns an error message or whether the element was scrolled
+        result = await self._callHelper("scrollIfNeeded", self._page._javascriptEnabled)
+        if isinstance(result, str):
+            raise Exception(result)
+
+    async def _scrollIntoViewAndGetClickablePoint(self) -> Dict[str, Number]:
+        # scrolls and, for the common single box case, computes the clickable
+        # point in the same evaluation
+        page = self._page
+        result = await self._callHelper(
+            "scrollAndGetClickablePoint", page._javascriptEnabled
         )
-        if error:
-            raise Exception(error)
+        if isinstance(result, str):
+            raise Exception(result)
+        point = result["point"]
+        if point is None:
+            return await self._clickablePoint()
+        return point
 
     async def _clickablePoint(self) -> Dict[str, Number]:
         try:
-            result, layoutMetrics = await gather(
-                self._client.send(
-                    "DOM.getContentQuads",
-                    {"objectId": self._remoteObject.get("objectId")},
-                ),
-                self._client.send("Page.getLayoutMetrics"),
+            result, clientSize = await gather(
+                self._send("DOM.getContentQuads", {"objectId": self._objectId}),
+                self._page._getClientSize(),
                 loop=self._client.loop,
             )
         except Exception:
             raise Exception("Node is either not visible or not an HTMLElement")
 
-        if not result.get("quads"):
+        protocolQuads = result["quads"]
+        if not protocolQuads:
             raise Exception("Node is either not visible or not an HTMLElement")
 
-        clientWidth = layoutMetrics["layoutViewport"]["clientWidth"]
-        clientHeight = layoutMetrics["layoutViewport"]["clientHeight"]
-        quads: List[List[Dict[str, Number]]] = []
-        add_quad = quads.append
-        for pquad in result.get("quads"):
-            quad = fromProtocolQuad(pquad)
-            if (
-                computeQuadArea(
-                    intersectQuadWithViewport(quad, clientWidth, clientHeight)
-                )
-                > 1
-            ):
-                add_quad(quad)
-        if len(quads) == 0:
+        clientWidth = clientSize["width"]
+        clientHeight = clientSize["height"]
+        for quad in protocolQuads:
+            if computeVisibleQuadArea(quad, clientWidth, clientHeight) > 1:
+                break
+        else:
             raise Exception("Node is either not visible or not an HTMLElement")
-        quad = quads[0]
-        x = 0.0
-        y = 0.0
-        for point in quad:
-            x += point["x"]
-            y += point["y"]
-        return {"x": x / 4, "y": y / 4}
+        return {
+            "x": (quad[0] + quad[2] + quad[4] + quad[6]) * 0.25,
+            "y": (quad[1] + quad[3] + quad[5] + quad[7]) * 0.25,
+        }
+
+    async def _screenshotGeometry(self) -> Optional[Dict[str, Number]]:
+        # the bounding box and scroll offsets of a rendered element of the top
+        # level document in one evaluation, None when DOM.getBoxModel and
+        # Page.getLayoutMetrics are needed instead, read by value in one call
+        return await self.executionContext._evaluateByValue(
+            SCREENSHOT_GEOMETRY_JS, self
+        )
 
     async def _getBoxModel(self) -> Optional[Dict]:
         try:
-            result: Optional[Dict] = await self._client.send(
-                "DOM.getBoxModel", {"objectId": self._remoteObject.get("objectId")}
+            result: Optional[Dict] = await self._send(
+                "DOM.getBoxModel", {"objectId": self._objectId}
             )
         except Exception:
             result = None
@@ -616,15 +662,6 @@ class ElementHandle(JSHandle):
         raise Exception("Node is either not visible or not an HTMLElement")
 
 
-def intersectQuadWithViewport(
-    quad: List[Dict[str, Number]], width: Number, height: Number
-) -> List[Dict[str, Number]]:
-    return [
-        {"x": min(max(point["x"], 0), width), "y": min(max(point["y"], 0), height)}
-        for point in quad
-    ]
-
-
 def fromProtocolQuad(quad: List[Number]) -> List[Dict[str, Number]]:
     return [
         {"x": quad[0], "y": quad[1]},
@@ -634,11 +671,211 @@ def fromProtocolQuad(quad: List[Number]) -> List[Dict[str, Number]]:
     ]
 
 
-def computeQuadArea(quad: List[Dict[str, Number]]) -> Number:
-    area = 0.0
-    qlen = len(quad)
-    for i in range(0, qlen):
-        p1 = quad[i]
-        p2 = quad[(i + 1) % qlen]
-        area += (p1["x"] * p2["y"] - p2["x"] * p1["y"]) / 2
-    return math.fabs(area)
+def computeVisibleQuadArea(
+    quad: List[Number], width: Number, height: Number
+) -> Number:
+    """Return the area of the protocol quad ``quad`` once clipped to a
+    ``width`` x ``height`` viewport.
+    """
+    # quads are always 4 points, so the clamping and the shoelace formula are
+    # unrolled over the flat protocol list
+    x0 = min(max(quad[0], 0), width)
+    y0 = min(max(quad[1], 0), height)
+    x1 = min(max(quad[2], 0), width)
+    y1 = min(max(quad[3], 0), height)
+    x2 = min(max(quad[4], 0), width)
+    y2 = min(max(quad[5], 0), height)
+    x3 = min(max(quad[6], 0), width)
+    y3 = min(max(quad[7], 0), height)
+    return (
+        abs(
+            (x0 * y1 - x1 * y0)
+            + (x1 * y2 - x2 * y1)
+            + (x2 * y3 - x3 * y2)
+            + (x3 * y0 - x0 * y3)
+        )
+        * 0.5
+    )
+
+
+JSON_VALUE_JS: str = "function() { return this; }"
+
+GET_PROPERTY_OF_THIS_JS: str = "function(propertyName) { return this[propertyName]; }"
+
+GET_PROPERTY_JS: str = """(object, propertyName) => {
+  const result = {__proto__: null};
+  result[propertyName] = object[propertyName];
+  return result;
+}"""
+
+INNER_TEXT_JS: str = """(element, newValue) => {
+  if (newValue) element.innerText = newValue;
+  return element.innerText;
+}"""
+
+INNER_HTML_JS: str = """(element, newValue) => {
+  if (newValue) element.innerHTML = newValue;
+  return element.innerHTML;
+}"""
+
+OUTER_HTML_JS: str = """(element, newValue) => {
+  if (newValue) element.outerHTML = newValue;
+  return element.outerHTML;
+}"""
+
+SCREENSHOT_GEOMETRY_JS: str = """element => {
+  if (window.top !== window || element.nodeType !== Node.ELEMENT_NODE || !element.isConnected)
+    return null;
+  if (element.getClientRects().length === 0) return null;
+  const rect = element.getBoundingClientRect();
+  return {
+    x: rect.x,
+    y: rect.y,
+    width: rect.width,
+    height: rect.height,
+    pageX: window.scrollX,
+    pageY: window.scrollY,
+  };
+}"""
+
+HAS_CHILD_NODES_JS: str = "element => element.hasChildNodes()"
+
+CHILD_ELEMENT_COUNT_JS: str = "element => element.childElementCount"
+
+GET_ATTRIBUTE_JS: str = "(element, attr) => element.getAttribute(attr)"
+
+FOCUS_JS: str = "element => element.focus()"
+
+QUERY_SELECTOR_JS: str = "(element, selector) => element.querySelector(selector)"
+
+QUERY_SELECTOR_ALL_JS: str = (
+    "(element, selector) => Array.from(element.querySelectorAll(selector))"
+)
+
+XPATH_JS: str = """(element, expression) => {
+  const document = element.ownerDocument || element;
+  const snapshot = document.evaluate(expression, element, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+  const length = snapshot.snapshotLength;
+  const array = new Array(length);
+  for (let i = 0; i < length; i++)
+    array[i] = snapshot.snapshotItem(i);
+  return array;
+}"""
+
+
+_SELECTOR_NOT_FOUND: str = "__simplechrome_selector_not_found__"
+#: the EvaluationError message of the function returned by querySelectorEvalJS
+#: when no element matches the selector
+_SELECTOR_NOT_FOUND_ERROR: str = f"Evaluation failed: {_SELECTOR_NOT_FOUND}"
+
+
+def querySelectorEvalJS(pageFunction: str) -> str:
+    """Return a function that calls ``pageFunction`` with the first element
+    matching the selector and returns its value as is. A missing element is
+    reported by throwing :data:`_SELECTOR_NOT_FOUND`.
+    """
+    return f"""(element, selector, ...args) => {{
+  const node = element.querySelector(selector);
+  if (!node) throw '{_SELECTOR_NOT_FOUND}';
+  return (
+{pageFunction}
+  )(node, ...args);
+}}"""
+
+
+def querySelectorAllEvalJS(pageFunction: str) -> str:
+    """Return a function that calls ``pageFunction`` with all the elements
+    matching the selector.
+    """
+    return f"""(element, selector, ...args) => (
+{pageFunction}
+)(Array.from(element.querySelectorAll(selector)), ...args)"""
+
+
+#: the property of ``window`` holding the element helpers, a registered symbol
+#: so that it neither collides with nor shows up among the page's own globals
+_HELPERS_KEY: str = "Symbol.for('simplechrome.elementHelpers')"
+
+#: Script that installs the element helpers used by :class:`ElementHandle` in a
+#: document, it is sent with the first helper call in an execution context so
+#: that the helpers' source is only compiled once per document
+ELEMENT_HELPERS_SCRIPT: str = """(() => {
+  const visibleRatio = element => new Promise(resolve => {
+    const observer = new IntersectionObserver(entries => {
+      resolve(entries[0].intersectionRatio);
+      observer.disconnect();
+    });
+    observer.observe(element);
+  });
+  const scrollIfNeeded = async (element, pageJavascriptEnabled) => {
+    if (!element.isConnected)
+      return 'Node is detached from document';
+    if (element.nodeType !== Node.ELEMENT_NODE)
+      return 'Node is not of type HTMLElement';
+    // force-scroll if page's javascript is disabled.
+    if (!pageJavascriptEnabled || (await visibleRatio(element)) !== 1.0) {
+      element.scrollIntoView({block: 'center', inline: 'center', behavior: 'instant'});
+      return true;
+    }
+    return false;
+  };
+  // center of the element if it is made up of a single box in the top level
+  // viewport that is visible, otherwise null and the protocol quads are needed
+  const clickablePoint = element => {
+    if (window.top !== window) return null;
+    const rects = element.getClientRects();
+    if (rects.length !== 1) return null;
+    const rect = rects[0];
+    // documentElement's client size is the whole document in quirks mode
+    const viewport = window.visualViewport;
+    const width = viewport ? viewport.width : window.innerWidth;
+    const height = viewport ? viewport.height : window.innerHeight;
+    const visibleWidth = Math.min(rect.right, width) - Math.max(rect.left, 0);
+    const visibleHeight = Math.min(rect.bottom, height) - Math.max(rect.top, 0);
+    if (visibleWidth <= 0 || visibleHeight <= 0 || visibleWidth * visibleHeight <= 1)
+      return null;
+    return {x: rect.left + rect.width / 2, y: rect.top + rect.height / 2};
+  };
+  Object.defineProperty(window, %s, {
+    configurable: true,
+    enumerable: false,
+    writable: true,
+    value: {
+      scrollIfNeeded,
+      async scrollAndGetClickablePoint(element, pageJavascriptEnabled) {
+        const scrolled = await scrollIfNeeded(element, pageJavascriptEnabled);
+        if (typeof scrolled === 'string') return scrolled;
+        return {scrolled, point: clickablePoint(element)};
+      },
+      async isInViewport(element) {
+        return (await visibleRatio(element)) > 0;
+      },
+    },
+  });
+})();""" % _HELPERS_KEY
+
+_HELPERS_MISSING: str = "__simplechrome_helpers_missing__"
+
+
+def _helperCallSources(name: str) -> Tuple[str, str]:
+    """Return the short call of the element helper ``name`` and its fallback
+    that (re-)installs the helpers, for contexts where they are missing.
+    """
+    return (
+        f"""(element, ...args) => {{
+  const helpers = window[{_HELPERS_KEY}];
+  if (helpers == null || typeof helpers.{name} !== 'function')
+    return '{_HELPERS_MISSING}';
+  return helpers.{name}(element, ...args);
+}}""",
+        f"""(element, ...args) => {{
+{ELEMENT_HELPERS_SCRIPT}
+return window[{_HELPERS_KEY}].{name}(element, ...args);
+}}""",
+    )
+
+
+_HELPER_SOURCES: Dict[str, Tuple[str, str]] = {
+    name: _helperCallSources(name)
+    for name in ("scrollIfNeeded", "scrollAndGetClickablePoint", "isInViewport")
+}
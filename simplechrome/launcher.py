@@ -5,26 +5,47 @@ import atexit
 import logging
 import os
 import os.path
-import re
+import select
 import shutil
 import signal
+import socket
 import sys
-from asyncio import AbstractEventLoop
+import time
+from asyncio import AbstractEventLoop, Future, StreamReader, Task
+from asyncio.subprocess import DEVNULL, PIPE, Process
+from functools import lru_cache
 from pathlib import Path
-from subprocess import DEVNULL, PIPE, Popen
-from tempfile import mkdtemp
-from typing import Any, Dict, List, Optional, Union
+from tempfile import gettempdir, mkdtemp
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from appdirs import AppDirs
 
-from ._typings import Loop, OptionalLoop
+from ._typings import Loop, Number, OptionalLoop
 from .browser_fetcher import BrowserFetcher
-from .chrome import Chrome
+from .chrome import BrowserContext, Chrome
 from .connection import Connection, createForWebSocket
 from .errors import LauncherError
-from .helper import Helper
-
-__all__ = ["Launcher", "launch", "connect", "DEFAULT_ARGS"]
+from .helper import EMPTY_OPTIONS, Helper
+
+__all__ = [
+    "BrowserPool",
+    "Launcher",
+    "launch",
+    "connect",
+    "reap_orphaned_user_data_dirs",
+    "DEFAULT_ARGS",
+]
 
 DEFAULT_CHROMIUM_REVISION: str = "656675"
 CHROMIUM_REVISION: str = os.getenv(
@@ -36,9 +57,12 @@ SIMPLECHROME_HOME: str = os.getenv(
 
 logger = logging.getLogger(__name__)
 
+#: what chrome prints to stderr right before its DevTools websocket endpoint
+DEVTOOLS_LISTENING: bytes = b"DevTools listening on "
+
 # https://peter.sh/experiments/chromium-command-line-switches/
 # https://cs.chromium.org/chromium/src/chrome/common/chrome_switches.cc
-DEFAULT_ARGS = [
+DEFAULT_ARGS: Tuple[str, ...] = (
     "--autoplay-policy=no-user-gesture-required",
     "--disable-background-networking",
     "--disable-background-timer-throttling",
@@ -62,30 +86,205 @@ DEFAULT_ARGS = [
     "--metrics-recording-only",
     "--no-first-run",
     "--safebrowsing-disable-auto-update",
-]
+)
+
+#: switches added by the ``disableDiskCache`` launch option
+DISK_CACHE_ARGS: Tuple[str, ...] = (
+    "--aggressive-cache-discard",
+    "--disk-cache-size=1",
+    "--media-cache-size=1",
+)
+
+#: RAM backed directory preferred for temporary user data directories
+SHM_DIR: str = "/dev/shm"
+#: free space SHM_DIR must have for a temporary user data directory to be put there
+SHM_MIN_FREE: int = 512 * 1024 * 1024
+#: prefix of the temporary user data directories
+USER_DATA_DIR_PREFIX: str = "simplechrome-"
+#: default age in seconds for :func:`reap_orphaned_user_data_dirs`
+ORPHAN_MAX_AGE: int = 3600
+#: seconds to wait for a killed chrome to exit
+KILL_WAIT_TIMEOUT: float = 2.0
 
 Options = Dict[str, Union[int, str, bool, List[str]]]
 
+#: the kill callbacks of the launched chromes to run when a handled signal is received
+_signalKillers: Dict[int, Set[Callable[[], Any]]] = {}
+
+
+#: handlers replaced with signal.signal where the loop has no add_signal_handler
+_previousSignalHandlers: Dict[int, Any] = {}
 
-def args_include(args: List[str], needle: str) -> bool:
-    for arg in args:
-        if needle in arg:
-            return True
-    return False
 
+def _killOnSignal(sig: int) -> None:
+    for kill in list(_signalKillers.get(sig, ())):
+        kill()
 
-def includes_starting_page(args: List[str]) -> bool:
-    for arg in args:
-        if not arg.startswith("-"):
-            return True
-    return False
 
+def _addSignalHandler(loop: AbstractEventLoop, sig: int) -> None:
+    try:
+        loop.add_signal_handler(sig, _killOnSignal, sig)
+    except NotImplementedError:
+        # e.g. the ProactorEventLoop on windows, hand the signal over to the loop
+        # rather than killing chrome from inside the signal handler
+        _previousSignalHandlers[sig] = signal.signal(
+            sig, lambda signum, frame: loop.call_soon_threadsafe(_killOnSignal, signum)
+        )
 
-def default_args(opts: Dict) -> List[str]:
-    chromeArgs: List[str] = list(DEFAULT_ARGS)
-    udata = opts.get("userDataDir", None)
-    devtools = opts.get("devtools", False)
-    headless = opts.get("headless", not devtools)
+
+def _removeSignalHandler(loop: AbstractEventLoop, sig: int) -> None:
+    if sig in _previousSignalHandlers:
+        signal.signal(sig, _previousSignalHandlers.pop(sig))
+        return
+    try:
+        loop.remove_signal_handler(sig)
+    except Exception:
+        pass
+
+
+async def wait_for_ws_endpoint(stderr: StreamReader) -> Optional[str]:
+    """Read chrome's ``stderr`` until it announces its DevTools websocket endpoint.
+
+    Returns None if chrome exits without announcing it.
+    """
+    try:
+        while 1:
+            try:
+                await stderr.readuntil(DEVTOOLS_LISTENING)
+                break
+            except asyncio.LimitOverrunError as e:
+                # more output than the stream buffers, skip what was scanned
+                await stderr.readexactly(e.consumed)
+        endpoint = await stderr.readuntil(b"\n")
+    except asyncio.IncompleteReadError:
+        return None
+    return endpoint.strip().decode("ascii")
+
+
+async def drain_stream(stream: StreamReader) -> None:
+    """Read ``stream`` until EOF so that the writing process never blocks on it."""
+    while await stream.read(65536):
+        pass
+
+
+def make_user_data_dir() -> str:
+    """Create a temporary user data directory.
+
+    The directory is created in :data:`SHM_DIR` when it exists and has at least
+    :data:`SHM_MIN_FREE` bytes free so that chrome's profile I/O stays in RAM,
+    otherwise in the default temporary directory.
+    """
+    try:
+        stat = os.statvfs(SHM_DIR)
+        if stat.f_bavail * stat.f_frsize >= SHM_MIN_FREE:
+            return mkdtemp(prefix=USER_DATA_DIR_PREFIX, dir=SHM_DIR)
+    except (AttributeError, OSError):
+        # no statvfs on windows, no /dev/shm on macOS
+        pass
+    return mkdtemp(prefix=USER_DATA_DIR_PREFIX)
+
+
+def wait_for_exit(pid: int, timeout: float) -> None:
+    """Block until the process ``pid`` exits or ``timeout`` seconds elapse.
+
+    Only meant for when there is no running event loop left to wait with, the
+    exit is waited for with a pidfd where the platform has them (Linux 5.3+).
+    """
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is not None:
+        try:
+            pidfd = pidfd_open(pid)
+        except ProcessLookupError:
+            return
+        except OSError:
+            pass
+        else:
+            try:
+                poller = select.poll()
+                poller.register(pidfd, select.POLLIN)
+                poller.poll(timeout * 1000)
+            finally:
+                os.close(pidfd)
+            return
+    WNOHANG = getattr(os, "WNOHANG", None)
+    if WNOHANG is None:
+        return
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if os.waitpid(pid, WNOHANG) != (0, 0):
+                return
+        except ChildProcessError:
+            return
+        time.sleep(0.05)
+
+
+def user_data_dir_in_use(path: str) -> bool:
+    """Return True if a running chrome holds the profile lock of ``path``."""
+    try:
+        # chrome's lock is a symlink to "<hostname>-<pid>"
+        owner = os.readlink(os.path.join(path, "SingletonLock"))
+    except OSError:
+        return False
+    hostname, _, pid = owner.rpartition("-")
+    if hostname != socket.gethostname():
+        # held by another machine, its processes cannot be checked from here
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except (OSError, ValueError):
+        return True
+    return True
+
+
+def reap_orphaned_user_data_dirs(maxAge: Number = ORPHAN_MAX_AGE) -> None:
+    """Remove the temporary user data directories left behind by chrome
+    processes whose launcher never cleaned up after them, e.g. because the
+    python process was killed.
+
+    A directory is removed once it is older than ``maxAge`` seconds and no
+    running chrome holds its profile lock. Headless chrome does not take the
+    profile lock, so only call this when no other process on this machine
+    runs chrome from a temporary user data directory it has had for longer
+    than ``maxAge``. It is never called by the launcher itself.
+    """
+    if sys.platform.startswith("win"):
+        # the profile lock is not a symlink there, so liveness can not be told
+        return
+    cutoff = time.time() - maxAge
+    for parent in {gettempdir(), SHM_DIR}:
+        try:
+            with os.scandir(parent) as it:
+                entries = [
+                    entry
+                    for entry in it
+                    if entry.name.startswith(USER_DATA_DIR_PREFIX)
+                ]
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if (
+                    not entry.is_dir(follow_symlinks=False)
+                    or entry.stat(follow_symlinks=False).st_mtime > cutoff
+                    or user_data_dir_in_use(entry.path)
+                ):
+                    continue
+            except OSError:
+                continue
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+
+@lru_cache(maxsize=32)
+def default_switches(
+    udata: Any, devtools: bool, headless: bool, disableDiskCache: bool
+) -> Tuple[str, ...]:
+    """Return the switches :func:`default_args` derives from the launch options,
+    a few combinations of them cover nearly every launch.
+    """
+    chromeArgs: List[str] = [*DEFAULT_ARGS]
     if udata:
         chromeArgs.append(f"--user-data-dir={udata}")
     if devtools:
@@ -95,18 +294,37 @@ def default_args(opts: Dict) -> List[str]:
         chromeArgs.append("--hide-scrollbars")
         if sys.platform.startswith("win"):
             chromeArgs.append("--disable-gpu")
-    supplied_chrome_args = opts.get("args", [])
-    chromeArgs.extend(supplied_chrome_args)
-    return chromeArgs
+    if disableDiskCache:
+        chromeArgs.extend(DISK_CACHE_ARGS)
+    return tuple(chromeArgs)
+
+
+def default_args(opts: Mapping[str, Any]) -> List[str]:
+    devtools = bool(opts.get("devtools", False))
+    switches = default_switches(
+        opts.get("userDataDir", None),
+        devtools,
+        bool(opts.get("headless", not devtools)),
+        bool(opts.get("disableDiskCache", False)),
+    )
+    return [*switches, *opts.get("args", [])]
 
 
 class Launcher:
+    #: resolved executable paths keyed by (source, projectRoot or env path, revision)
+    _executableCache: ClassVar[Dict[Tuple[str, str, str], str]] = {}
+    #: in flight chromium downloads shared by concurrent launches, same keys
+    _executableDownloads: ClassVar[Dict[Tuple[str, str, str], Future]] = {}
+
     __slots__ = [
         "projectRoot",
         "preferredRevision",
         "chrome_dead",
         "_temp_udata",
         "_chrome_process",
+        "_loop",
+        "_stderr_drain",
+        "_signals",
     ]
 
     def __init__(
@@ -118,9 +336,12 @@ class Launcher:
         self.preferredRevision: str = preferredRevision
         self.chrome_dead: bool = False
         self._temp_udata: Optional[str] = None
-        self._chrome_process: Optional[Popen] = None
+        self._chrome_process: Optional[Process] = None
+        self._loop: Optional[AbstractEventLoop] = None
+        self._stderr_drain: Optional[Task] = None
+        self._signals: List[int] = []
 
-    async def build_args(self, opts: Dict, loop: Loop) -> List[str]:
+    async def build_args(self, opts: Mapping[str, Any], loop: Loop) -> List[str]:
         executable = opts.get("executablePath", None)
         if executable is None:
             executable = await self.resolveExecutablePath(opts, loop=loop)
@@ -129,25 +350,37 @@ class Launcher:
         if not ignoreDefaultArgs:
             chromeArguments.extend(default_args(opts))
         elif isinstance(ignoreDefaultArgs, list):
+            ignored = set(ignoreDefaultArgs)
             chromeArguments.extend(
-                [arg for arg in default_args(opts) if arg not in ignoreDefaultArgs]
+                [arg for arg in default_args(opts) if arg not in ignored]
             )
         else:
             chromeArguments.extend(opts.get("args", []))
 
+        # a single pass over the switches, the executable is not a starting page
+        hasRemoteDebugging = hasStartingPage = False
+        switches = set()
+        for arg in chromeArguments[1:]:
+            if arg[:1] != "-":
+                hasStartingPage = True
+                continue
+            switches.add(arg.split("=", 1)[0])
+            if arg.startswith("--remote-debugging-"):
+                hasRemoteDebugging = True
+
         port = opts.get("port", "0")
-        if not args_include(chromeArguments, "--remote-debugging-"):
+        if not hasRemoteDebugging:
             chromeArguments.append(f"--remote-debugging-port={port}")
 
-        if not args_include(chromeArguments, "--user-data-dir"):
-            self._temp_udata = mkdtemp()
+        if "--user-data-dir" not in switches:
+            self._temp_udata = make_user_data_dir()
             chromeArguments.append(f"--user-data-dir={self._temp_udata}")
-            if "--password-store=basic" not in chromeArguments:
+            if "--password-store" not in switches:
                 chromeArguments.append("--password-store=basic")
-            if "--use-mock-keychain" not in chromeArguments:
+            if "--use-mock-keychain" not in switches:
                 chromeArguments.append("--use-mock-keychain")
 
-        if not includes_starting_page(chromeArguments):
+        if not hasStartingPage:
             chromeArguments.append("about:blank")
 
         return chromeArguments
@@ -156,44 +389,62 @@ class Launcher:
         self, options: Optional[Dict] = None, loop: OptionalLoop = None, **kwargs: Any
     ) -> Chrome:
         loop_ = Helper.ensure_loop(loop)
-        opts = Helper.merge_dict(options, kwargs)
+        opts: Mapping[str, Any] = (
+            EMPTY_OPTIONS
+            if options is None and not kwargs
+            else Helper.merge_dict(options, kwargs)
+        )
         chromeArguments = await self.build_args(opts, loop=loop_)
-        browser_ws_re = re.compile("DevTools listening on (?P<websocket>ws:[^\n]+)$")
-        chrome_process: Popen = Popen(chromeArguments, stdout=DEVNULL, stderr=PIPE)
-        browser_ws = None
-        while 1:
-            line = chrome_process.stderr.readline()
-            m = browser_ws_re.match(line.decode("utf-8"))
-            if m:
-                browser_ws = m.group("websocket")
-                break
-            if chrome_process.stderr.closed or chrome_process.returncode is not None:
-                break
-        chrome_process.stderr.close()
+        chrome_process: Process = await asyncio.create_subprocess_exec(
+            *chromeArguments, stdout=DEVNULL, stderr=PIPE
+        )
+        self._loop = loop_
+        self._chrome_process = chrome_process
+        timeout = opts.get("timeout", 30)
+        try:
+            browser_ws = await asyncio.wait_for(
+                wait_for_ws_endpoint(chrome_process.stderr), timeout
+            )
+        except asyncio.TimeoutError:
+            self.__kill_chrome()
+            raise LauncherError(
+                f"Timed out after {timeout} seconds while waiting for chrome to start"
+            )
         if browser_ws is None or chrome_process.returncode is not None:
+            self.__kill_chrome()
             raise LauncherError("Could not launch chrome")
+        # chrome keeps logging to stderr, keep the pipe from filling up
+        self._stderr_drain = loop_.create_task(drain_stream(chrome_process.stderr))
 
-        self._chrome_process = chrome_process
         atexit.register(self.__kill_chrome)
 
-        if opts.get("handleSIGINT", True):
-            loop_.add_signal_handler(signal.SIGINT, self.__kill_chrome)
-        if opts.get("handleSIGTERM", True):
-            loop_.add_signal_handler(signal.SIGTERM, self.__kill_chrome)
-        if opts.get("handleSIGHUP", True):
-            loop_.add_signal_handler(signal.SIGHUP, self.__kill_chrome)
+        if opts.get("handleSignals", True):
+            if opts.get("handleSIGINT", True):
+                self._signals.append(signal.SIGINT)
+            if opts.get("handleSIGTERM", True):
+                self._signals.append(signal.SIGTERM)
+            # SIGHUP does not exist on windows
+            if opts.get("handleSIGHUP", True) and hasattr(signal, "SIGHUP"):
+                self._signals.append(signal.SIGHUP)
+            for sig in self._signals:
+                killers = _signalKillers.setdefault(sig, set())
+                if not killers:
+                    # one handler per signal kills every launched chrome
+                    _addSignalHandler(loop_, sig)
+                killers.add(self.__kill_chrome)
 
         try:
             connection: Connection = await createForWebSocket(browser_ws, loop=loop_)
             targets = await connection.send("Target.getTargets", {})
+            targetInfos = targets.get("targetInfos")
             chrome = await Chrome.create(
                 connection,
-                [],
+                (),
                 opts.get("ignoreHTTPSErrors", False),
                 opts.get("defaultViewPort"),
                 chrome_process,
                 self.__kill_chrome,
-                targetInfo=targets.get("targetInfos", [None])[0],
+                targetInfo=targetInfos[0] if targetInfos else None,
                 loop=loop_,
             )
             await chrome.waitForTarget(lambda t: t.type == "page")
@@ -203,46 +454,327 @@ class Launcher:
             raise
 
     async def resolveExecutablePath(
-        self, opts: Optional[Dict] = None, loop: Optional[AbstractEventLoop] = None
+        self,
+        opts: Optional[Mapping[str, Any]] = None,
+        loop: Optional[AbstractEventLoop] = None,
     ) -> str:
+        """Return the path of the chrome executable to launch.
+
+        The resolved path is cached per project root and revision, or per
+        ``SIMPLECHROME_EXECUTABLE_PATH`` value, see :meth:`clearExecutableCache`.
+        """
+        cache = Launcher._executableCache
         env_exe = os.getenv("SIMPLECHROME_EXECUTABLE_PATH", None)
         if env_exe is not None:
+            key = ("env", env_exe, "")
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
             if not Path(env_exe).exists():
                 raise LauncherError(
                     f"Tried to use SIMPLECHROME_EXECUTABLE_PATH env variable to launch browser but did not find any executable at: {env_exe}"
                 )
+            cache[key] = env_exe
             return env_exe
-        bf = BrowserFetcher(self.projectRoot)
         if opts is None:
-            opts = {}
+            opts = EMPTY_OPTIONS
         revision: Optional[str] = opts.get("chromium_revision")
         if revision is None:
             revision = self.preferredRevision
         if revision is None:
             revision = CHROMIUM_REVISION
-        exe_path = bf.revision_exe_path(revision)
-        if not exe_path.exists():
-            ri = await bf.download(revision, loop=loop)
-            return str(ri.executablePath)
-        return str(exe_path)
-
-    def __kill_chrome(self, *args: Any, **kwargs: Any) -> None:
+        key = ("revision", self.projectRoot, revision)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        download = Launcher._executableDownloads.get(key)
+        if download is None:
+            bf = BrowserFetcher(self.projectRoot)
+            exe_path = bf.revision_exe_path(revision)
+            if exe_path.exists():
+                cache[key] = str(exe_path)
+                return cache[key]
+            download = asyncio.ensure_future(
+                bf.download(revision, loop=loop), loop=loop
+            )
+            Launcher._executableDownloads[key] = download
+            download.add_done_callback(
+                lambda _: Launcher._executableDownloads.pop(key, None)
+            )
+        # a launch being cancelled must not cancel the download other launches share
+        ri = await asyncio.shield(download)
+        cache[key] = str(ri.executablePath)
+        return cache[key]
+
+    @classmethod
+    def clearExecutableCache(cls) -> None:
+        """Forget the executable paths resolved by :meth:`resolveExecutablePath`,
+        e.g. after a downloaded revision was removed.
+        """
+        cls._executableCache.clear()
+
+    def __kill_chrome(self, *args: Any, **kwargs: Any) -> Optional[Task]:
+        """Kill the chrome process.
+
+        The temporary user data directory is removed once chrome has exited,
+        or after :data:`KILL_WAIT_TIMEOUT` seconds. When the event loop is
+        running, that happens in the returned task, otherwise (e.g. at exit)
+        before returning.
+        """
+        if self.chrome_dead or self._chrome_process is None:
+            self.__removeUserDataDir()
+            return None
+        self.chrome_dead = True
+        self.__removeSignalHandlers()
+        if self._stderr_drain is not None:
+            self._stderr_drain.cancel()
         try:
-            if self._temp_udata is not None and os.path.exists(self._temp_udata):
-                shutil.rmtree(self._temp_udata)
+            self._chrome_process.kill()
         except Exception:
             pass
-        if self.chrome_dead:
+        if self._loop is None or not self._loop.is_running():
+            # called at exit, there is no loop left to wait with
+            wait_for_exit(self._chrome_process.pid, KILL_WAIT_TIMEOUT)
+            self.__removeUserDataDir()
+            return None
+        atexit.unregister(self.__kill_chrome)
+        return self._loop.create_task(self.__waitForExit())
+
+    async def __waitForExit(self) -> None:
+        try:
+            await asyncio.wait_for(self._chrome_process.wait(), KILL_WAIT_TIMEOUT)
+        except asyncio.TimeoutError:
+            # e.g. stuck in uninterruptible sleep, the loop's child watcher
+            # reaps it once it does exit
+            logger.warning(
+                f"Chrome (pid {self._chrome_process.pid}) did not exit within "
+                f"{KILL_WAIT_TIMEOUT} seconds of being killed"
+            )
+        self.__removeUserDataDir()
+
+    def __removeUserDataDir(self) -> None:
+        if self._temp_udata is not None:
+            shutil.rmtree(self._temp_udata, ignore_errors=True)
+
+    def __removeSignalHandlers(self) -> None:
+        for sig in self._signals:
+            killers = _signalKillers.get(sig)
+            if killers is None:
+                continue
+            killers.discard(self.__kill_chrome)
+            if not killers:
+                del _signalKillers[sig]
+                _removeSignalHandler(self._loop, sig)
+        self._signals.clear()
+
+
+class BrowserPool:
+    """A pool of launched browsers that hands out incognito browser contexts.
+
+    The browsers are launched by :meth:`start` or on first use and each one
+    serves a single checkout at a time. Once a browser has served
+    ``recycleAfter`` contexts it is closed and replaced by a freshly launched
+    one, capping the memory a long lived browser process accumulates.
+
+    Options are the same as :func:`launch`.
+
+    .. code-block:: python
+
+        pool = BrowserPool(size=2)
+        async with pool.acquire() as context:
+            page = await context.newPage()
+        await pool.close()
+    """
+
+    __slots__ = [
+        "_size",
+        "_recycleAfter",
+        "_options",
+        "_loop",
+        "_ready",
+        "_uses",
+        "_launches",
+        "_closing",
+        "_waiting",
+        "_recycled",
+        "_started",
+        "_closed",
+    ]
+
+    def __init__(
+        self,
+        size: int = 4,
+        recycleAfter: int = 100,
+        options: Optional[Dict] = None,
+        loop: OptionalLoop = None,
+        **kwargs: Any,
+    ) -> None:
+        if size < 1:
+            raise ValueError(f"size must be positive integer: {size}")
+        if recycleAfter < 1:
+            raise ValueError(f"recycleAfter must be positive integer: {recycleAfter}")
+        self._size: int = size
+        self._recycleAfter: int = recycleAfter
+        self._options: Dict = Helper.merge_dict(options, kwargs)
+        self._loop: Loop = Helper.ensure_loop(loop)
+        self._ready: asyncio.Queue = asyncio.Queue(loop=self._loop)
+        self._uses: Dict[Chrome, int] = {}
+        self._launches: Set[Task] = set()
+        self._closing: Set[Task] = set()
+        #: number of checkouts waiting for a browser
+        self._waiting: int = 0
+        self._recycled: int = 0
+        self._started: bool = False
+        self._closed: bool = False
+
+    def start(self) -> None:
+        """Launch the pool's browsers, does nothing if they were already launched."""
+        if self._closed:
+            raise LauncherError("The browser pool is closed")
+        if self._started:
             return
+        self._started = True
+        for _ in range(self._size):
+            self._launchBrowser()
+
+    def acquire(self) -> "PooledBrowserContext":
+        """Check out an incognito browser context, to be used with ``async with``.
+
+        The context is closed and its browser returned to the pool on exit.
+        """
+        return PooledBrowserContext(self)
+
+    async def checkout(self) -> BrowserContext:
+        """Wait for a browser and return a new incognito context of it.
+
+        The context must be handed back with :meth:`checkin`.
+        """
+        if self._closed:
+            raise LauncherError("The browser pool is closed")
+        self.start()
+        self._waiting += 1
         try:
-            self._chrome_process.kill()
+            browser = await self._ready.get()
+        finally:
+            self._waiting -= 1
+        if isinstance(browser, Exception):
+            # a launch failed, surface it to this waiter and try again
+            if not self._closed:
+                self._launchBrowser()
+            raise browser
+        try:
+            return await browser.createIncognitoBrowserContext()
         except Exception:
-            pass
+            self._recycle(browser)
+            raise
+
+    async def checkin(self, context: BrowserContext) -> None:
+        """Close ``context`` and return its browser to the pool."""
+        browser = context.browser()
         try:
-            self._chrome_process.wait()
+            await context.close()
         except Exception:
-            pass
-        self.chrome_dead = True
+            # the browser is in an unknown state, do not hand it out again
+            self._recycle(browser)
+            return
+        uses = self._uses[browser] = self._uses.get(browser, 0) + 1
+        if self._closed:
+            self._uses.pop(browser, None)
+            await browser.close()
+        elif uses >= self._recycleAfter:
+            self._recycle(browser)
+        else:
+            self._ready.put_nowait(browser)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the pool's current counters."""
+        ready = self._ready.qsize()
+        launching = len(self._launches)
+        return {
+            "size": self._size,
+            "ready": ready,
+            "inUse": len(self._uses) - ready,
+            "launching": launching,
+            "recycled": self._recycled,
+        }
+
+    async def close(self) -> None:
+        """Close the idle browsers of the pool and wait for the recycled ones
+        to finish closing.
+
+        Browsers that are checked out are closed when their context is checked in
+        and checkouts still waiting for a browser raise a ``LauncherError``.
+        """
+        self._closed = True
+        for task in self._launches:
+            task.cancel()
+        self._launches.clear()
+        idle = []
+        while not self._ready.empty():
+            browser = self._ready.get_nowait()
+            if isinstance(browser, Chrome):
+                idle.append(browser)
+        # wake the waiting checkouts, they re-raise the exception they receive
+        for _ in range(self._waiting):
+            self._ready.put_nowait(LauncherError("The browser pool is closed"))
+        for browser in idle:
+            self._uses.pop(browser, None)
+            await browser.close()
+        if self._closing:
+            # failures are logged by _onBrowserClosed
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+    def _launchBrowser(self) -> None:
+        task = self._loop.create_task(self._launch())
+        self._launches.add(task)
+        task.add_done_callback(self._launches.discard)
+
+    async def _launch(self) -> None:
+        try:
+            browser = await Launcher().launch(self._options, loop=self._loop)
+        except Exception as e:
+            logger.exception("Launching a pooled browser failed")
+            self._ready.put_nowait(e)
+            return
+        if self._closed:
+            await browser.close()
+            return
+        self._uses[browser] = 0
+        self._ready.put_nowait(browser)
+
+    def _recycle(self, browser: Chrome) -> None:
+        self._uses.pop(browser, None)
+        self._recycled += 1
+        task = self._loop.create_task(browser.close())
+        self._closing.add(task)
+        task.add_done_callback(self._onBrowserClosed)
+        if not self._closed:
+            self._launchBrowser()
+
+    def _onBrowserClosed(self, task: Task) -> None:
+        self._closing.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Closing a pooled browser failed", exc_info=task.exception())
+
+
+class PooledBrowserContext:
+    """Async context manager returned by :meth:`BrowserPool.acquire`."""
+
+    __slots__ = ["_pool", "_context"]
+
+    def __init__(self, pool: BrowserPool) -> None:
+        self._pool: BrowserPool = pool
+        self._context: Optional[BrowserContext] = None
+
+    async def __aenter__(self) -> BrowserContext:
+        self._context = await self._pool.checkout()
+        return self._context
+
+    async def __aexit__(self, *args: Any) -> None:
+        context = self._context
+        self._context = None
+        if context is not None:
+            await self._pool.checkin(context)
 
 
 async def launch(
@@ -269,7 +801,7 @@ async def connect(
     targetInfo = await con.send("Target.getTargetInfo")
     return await Chrome.create(
         con,
-        contextIds=[],
+        contextIds=(),
         ignoreHTTPSErrors=options.get("ignoreHTTPSErrors", False),
         defaultViewport=options.get("defaultViewPort"),
         process=None,
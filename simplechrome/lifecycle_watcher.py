@@ -1,12 +1,21 @@
-from asyncio import Future, Task, TimeoutError
-from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING, Union
-
-from async_timeout import timeout
+from asyncio import Future, TimerHandle
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Optional,
+    TYPE_CHECKING,
+    Tuple,
+    Union,
+)
 
 from ._typings import Loop, OptionalLoop, OptionalNumber
 from .errors import NavigationError
 from .events import Events
-from .helper import EEListener, Helper
+from .helper import EEType, Helper
 
 if TYPE_CHECKING:
     from .frame_manager import FrameManager, Frame  # noqa: F401
@@ -24,6 +33,15 @@ WaitToProtocolLifecycle: Dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=32)
+def resolve_expected_lifecycle(waitUntil: Tuple[str, ...]) -> FrozenSet[str]:
+    """Returns the protocol lifecycle events for the (sorted) waitUntil values"""
+    unknown = [value for value in waitUntil if value not in WaitToProtocolLifecycle]
+    if unknown:
+        raise ValueError(f"Unknown value(s) for options.waitUntil: {unknown}")
+    return frozenset(WaitToProtocolLifecycle[value] for value in waitUntil)
+
+
 class LifecycleWatcher:
     __slots__ = [
         "__weakref__",
@@ -42,7 +60,7 @@ class LifecycleWatcher:
         "_sameDocumentNavigationPromise",
         "_terminationPromise",
         "_timeout",
-        "_timeoutPromise",
+        "_timeoutHandle",
         "_waitUntil",
     ]
 
@@ -66,56 +84,55 @@ class LifecycleWatcher:
         ] = self._frameManager._networkManager
         self._navigationRequest: Optional["Request"] = None
         self._initialLoaderId: str = self._frame._loaderId
-        self._expectedLifecycle: List[str] = []
         self._hasSameDocumentNavigation: bool = False
-        self._build_expected_lifecyle()
-        self._eventListeners: List[EEListener] = [
-            Helper.addEventListener(
-                self._frameManager._client,
-                self._frameManager._client.Events.Disconnected,
-                lambda: self._terminate(
-                    NavigationError.Disconnected(
-                        "Navigation failed because browser has disconnected!",
-                        response=self.navigationResponse,
-                    )
-                ),
-            ),
-            Helper.addEventListener(
-                self._frameManager,
-                Events.FrameManager.LifecycleEvent,
+        self._expectedLifecycle: FrozenSet[str] = self._build_expected_lifecyle()
+        client = self._frameManager._client
+        frameManagerEvents = Events.FrameManager
+        listeners: Tuple[Tuple[EEType, str, Callable], ...] = (
+            (client, client.Events.Disconnected, self._onDisconnected),
+            (
+                frameManager,
+                frameManagerEvents.LifecycleEvent,
                 self._checkLifecycleComplete,
             ),
-            Helper.addEventListener(
-                self._frameManager,
-                Events.FrameManager.FrameDetached,
-                self._onFrameDetached,
-            ),
-            Helper.addEventListener(
-                self._frameManager,
-                Events.FrameManager.FrameNavigatedWithinDocument,
+            (frameManager, frameManagerEvents.FrameDetached, self._onFrameDetached),
+            (
+                frameManager,
+                frameManagerEvents.FrameNavigatedWithinDocument,
                 self._navigatedWithinDocument,
             ),
-        ]
+        )
         if self._networkManager is not None:
-            self._eventListeners.append(
-                Helper.addEventListener(
-                    self._networkManager, Events.NetworkManager.Request, self._onRequest
-                )
+            listeners += (
+                (self._networkManager, Events.NetworkManager.Request, self._onRequest),
             )
+        for emitter, eventName, handler in listeners:
+            emitter.on(eventName, handler)
+        self._eventListeners: Tuple[Tuple[EEType, str, Callable], ...] = listeners
 
         self._sameDocumentNavigationPromise: Future = self._loop.create_future()
         self._lifecyclePromise: Future = self._loop.create_future()
         self._newDocumentNavigationPromise: Future = self._loop.create_future()
-        self._timeoutPromise: Future = self._createTimeoutPromise()
         self._terminationPromise: Future = self._loop.create_future()
+        self._timeoutHandle: Optional[TimerHandle] = None
+        if self._timeout is not None:
+            self._timeoutHandle = self._loop.call_later(self._timeout, self._onTimeout)
         self._checkLifecycleComplete()
 
+    @property
+    def timeoutOrTerminationPromise(self) -> Future:
+        """Resolves to the NavigationError of a timeout, browser disconnect
+        or detach of the navigating frame, whichever happens first"""
+        return self._terminationPromise
+
     @property
     def timeoutPromise(self) -> Future:
-        return self._timeoutPromise
+        """Alias of :attr:`timeoutOrTerminationPromise`"""
+        return self._terminationPromise
 
     @property
     def terminationPromise(self) -> Future:
+        """Alias of :attr:`timeoutOrTerminationPromise`"""
         return self._terminationPromise
 
     @property
@@ -137,46 +154,71 @@ class LifecycleWatcher:
         return None
 
     def dispose(self) -> None:
-        Helper.removeEventListeners(self._eventListeners)
+        if self._timeoutHandle is not None:
+            self._timeoutHandle.cancel()
+        self._removeEventListeners()
         Helper.cleanup_futures(
             self._terminationPromise,
-            self._timeoutPromise,
             self._lifecyclePromise,
             self._sameDocumentNavigationPromise,
             self._newDocumentNavigationPromise,
         )
 
+    def _removeEventListeners(self) -> None:
+        for emitter, eventName, handler in self._eventListeners:
+            emitter.remove_listener(eventName, handler)
+        self._eventListeners = ()
+
     def _checkLifecycleComplete(self, *args: Any, **kwargs: Any) -> None:
-        if not self._checkLifecycle(self._frame, self._expectedLifecycle):
-            return
-        if not self._lifecyclePromise.done():
-            self._lifecyclePromise.set_result(None)
+        lifecyclePromise = self._lifecyclePromise
+        sameDocumentNavigationPromise = self._sameDocumentNavigationPromise
+        newDocumentNavigationPromise = self._newDocumentNavigationPromise
         if (
-            self._frame._loaderId == self._initialLoaderId
-            and not self._hasSameDocumentNavigation
+            lifecyclePromise.done()
+            and sameDocumentNavigationPromise.done()
+            and newDocumentNavigationPromise.done()
         ):
             return
-        if (
-            self._hasSameDocumentNavigation
-            and not self._sameDocumentNavigationPromise.done()
-        ):
-            self._sameDocumentNavigationPromise.set_result(None)
-        if (
-            self._frame._loaderId != self._initialLoaderId
-            and not self._newDocumentNavigationPromise.done()
-        ):
-            self._newDocumentNavigationPromise.set_result(None)
+        if not self._checkLifecycle(self._frame):
+            return
+        if not lifecyclePromise.done():
+            lifecyclePromise.set_result(None)
+        hasSameDocumentNavigation = self._hasSameDocumentNavigation
+        hasNewDocument = self._frame._loaderId != self._initialLoaderId
+        if not (hasSameDocumentNavigation or hasNewDocument):
+            return
+        if hasSameDocumentNavigation and not sameDocumentNavigationPromise.done():
+            sameDocumentNavigationPromise.set_result(None)
+        if hasNewDocument and not newDocumentNavigationPromise.done():
+            newDocumentNavigationPromise.set_result(None)
+        if sameDocumentNavigationPromise.done() and newDocumentNavigationPromise.done():
+            # nothing is left to resolve, stop being dispatched to until disposed
+            self._removeEventListeners()
 
-    def _checkLifecycle(self, frame: "Frame", expectedLifecycle: List[str]) -> bool:
-        for event in expectedLifecycle:
-            if event not in frame._lifecycleEvents:
+    def _checkLifecycle(self, frame: "Frame") -> bool:
+        expectedLifecycle = self._expectedLifecycle
+        if not expectedLifecycle.issubset(frame._lifecycleEvents):
+            return False
+        if not self._all_frames or not frame._childFrames:
+            return True
+        frames = [*frame._childFrames]
+        while frames:
+            frame = frames.pop()
+            if not expectedLifecycle.issubset(frame._lifecycleEvents):
                 return False
-        if self._all_frames:
-            for child in frame.childFrames:
-                if not self._checkLifecycle(child, expectedLifecycle):
-                    return False
+            childFrames = frame._childFrames
+            if childFrames:
+                frames.extend(childFrames)
         return True
 
+    def _onDisconnected(self) -> None:
+        self._terminate(
+            NavigationError.Disconnected(
+                "Navigation failed because browser has disconnected!",
+                response=self.navigationResponse,
+            )
+        )
+
     def _terminate(self, error: Exception) -> None:
         if not self._terminationPromise.done():
             self._terminationPromise.set_result(error)
@@ -202,36 +244,21 @@ class LifecycleWatcher:
             return
         self._navigationRequest = request
 
-    def _createTimeoutPromise(self) -> Union[Future, Task]:
-        timeoutPromise = self._loop.create_future()
-        if self._timeout is not None:
-            return self._loop.create_task(self._timeout_func(timeoutPromise))
-        return timeoutPromise
-
-    async def _timeout_func(self, timeoutPromise: Future) -> Optional[NavigationError]:
-        try:
-            async with timeout(self._timeout, loop=self._loop):
-                await timeoutPromise
-        except TimeoutError:
-            return NavigationError.TimedOut(
+    def _onTimeout(self) -> None:
+        self._terminate(
+            NavigationError.TimedOut(
                 f"Navigation Timeout Exceeded: {self._timeout} seconds exceeded.",
                 response=self.navigationResponse,
             )
-        return None
+        )
 
-    def _build_expected_lifecyle(self) -> None:
+    def _build_expected_lifecyle(self) -> FrozenSet[str]:
         waitUntil = self._waitUntil
-        if isinstance(waitUntil, list):
-            waitUntil = waitUntil
-        elif isinstance(waitUntil, str):
-            waitUntil = [waitUntil]
-        else:
-            waitUntil = ["load"]
-        for value in waitUntil:
-            protocolEvent = WaitToProtocolLifecycle.get(value)
-            if protocolEvent is None:
-                raise ValueError(f"Unknown value for options.waitUntil: {value}")
-            self._expectedLifecycle.append(protocolEvent)
+        if isinstance(waitUntil, str):
+            waitUntil = (waitUntil,)
+        elif not isinstance(waitUntil, (list, tuple)):
+            waitUntil = ("load",)
+        return resolve_expected_lifecycle(tuple(sorted(waitUntil)))
 
     def __str__(self) -> str:
         info = f"all_frames={self._all_frames}, waitUntil={self._waitUntil}, timeout={self._timeout}"
@@ -1,5 +1,5 @@
 from asyncio import AbstractEventLoop
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from pyee2 import EventEmitterS
 
@@ -12,6 +12,9 @@ __all__ = ["Log", "LogEntry"]
 
 ViolationSetting = Dict[str, Union[str, Number]]
 
+#: marks a LogEntry location that has not been looked up yet
+_UNRESOLVED: object = object()
+
 
 class Log(EventEmitterS):
     """Provides access to log entries"""
@@ -89,13 +92,14 @@ class Log(EventEmitterS):
     def _onLogEntryAdded(self, event: CDPEvent) -> None:
         entry = event.get("entry")
         args = entry.get("args")
-        if args is not None:
-            self._loop.create_task(self._release_log_args(args))
-        self.emit(LogEvents.EntryAdded, LogEntry(entry))
-
-    async def _release_log_args(self, args: List[Dict]) -> None:
-        for arg in args:
-            await Helper.releaseObject(self._client, arg)
+        if args:
+            # release remote objects concurrently, primitives have nothing to release
+            create_task = self._loop.create_task
+            for arg in args:
+                if arg.get("objectId"):
+                    create_task(Helper.releaseObject(self._client, arg))
+        if self.listener_count(LogEvents.EntryAdded):
+            self.emit(LogEvents.EntryAdded, LogEntry(entry))
 
     def __str__(self) -> str:
         return f"Log(enabled={self._enabled}, reporting_violations={self._reporting_violations})"
@@ -107,7 +111,18 @@ class Log(EventEmitterS):
 class LogEntry:
     """An abstraction around Log.LogEntry"""
 
-    __slots__: List[str] = ["_entry", "_location"]
+    __slots__: List[str] = [
+        "_entry",
+        "_level",
+        "_lineNumber",
+        "_location",
+        "_networkRequestId",
+        "_source",
+        "_stackTrace",
+        "_timestamp",
+        "_url",
+        "_workerId",
+    ]
 
     def __init__(self, entry: Dict) -> None:
         """Initialize a new LogEntry
@@ -115,16 +130,17 @@ class LogEntry:
         :param entry: The value for the log entry sent by the CDP
         """
         self._entry: Dict = entry
-        self._location: Optional[Dict] = None
-        call_frames: List[Dict] = self._entry.get("stackTrace", {}).get(
-            "call_frames", []
-        )
-        if call_frames:
-            self._location = {
-                "url": call_frames[0].get("url"),
-                "lineNumber": call_frames[0].get("lineNumber"),
-                "columnNumber": call_frames[0].get("columnNumber"),
-            }
+        get = entry.get
+        self._level: str = get("level")
+        self._lineNumber: Optional[int] = get("lineNumber")
+        self._networkRequestId: Optional[str] = get("networkRequestId")
+        self._source: str = get("source")
+        self._stackTrace: Optional[Dict] = get("stackTrace")
+        self._timestamp: Optional[Number] = get("timestamp")
+        self._url: Optional[str] = get("url")
+        self._workerId: Optional[str] = get("workerId")
+        # most entries never have their location read, build it on first access
+        self._location: Any = _UNRESOLVED
 
     @property
     def cdp_entry(self) -> Dict:
@@ -141,27 +157,40 @@ class LogEntry:
             - warning
             - error
         """
-        return self._entry.get("level")
+        return self._level
 
     @property
     def lineNumber(self) -> Optional[int]:
         """Line number in the resource"""
-        return self._entry.get("lineNumber")
+        return self._lineNumber
 
     @property
     def location(self) -> Optional[Dict[str, Union[str, int]]]:
         """Where did this log entry message occur"""
-        return self._location
+        location = self._location
+        if location is _UNRESOLVED:
+            location = None
+            stackTrace = self._stackTrace
+            callFrames = stackTrace.get("callFrames") if stackTrace else None
+            if callFrames:
+                callFrame = callFrames[0]
+                location = {
+                    "url": callFrame.get("url"),
+                    "lineNumber": callFrame.get("lineNumber"),
+                    "columnNumber": callFrame.get("columnNumber"),
+                }
+            self._location = location
+        return location
 
     @property
     def networkRequestId(self) -> Optional[str]:
         """Identifier of the network request associated with this entry"""
-        return self._entry.get("networkRequestId")
+        return self._networkRequestId
 
     @property
     def stackTrace(self) -> Optional[Dict]:
         """JavaScript stack trace"""
-        return self._entry.get("stackTrace")
+        return self._stackTrace
 
     @property
     def source(self) -> str:
@@ -182,27 +211,27 @@ class LogEntry:
            - recommendation
            - other
         """
-        return self._entry.get("source")
+        return self._source
 
     @property
     def timestamp(self) -> Optional[Number]:
         """Timestamp when this entry was added"""
-        return self._entry.get("timestamp")
+        return self._timestamp
 
     @property
     def type(self) -> str:
         """Type of the entry"""
-        return self.level
+        return self._level
 
     @property
     def url(self) -> Optional[str]:
         """URL of the resource if known"""
-        return self._entry.get("url")
+        return self._url
 
     @property
     def workerId(self) -> Optional[str]:
         """Identifier of the worker associated with this entry"""
-        return self._entry.get("workerId")
+        return self._workerId
 
     def __str__(self) -> str:
         return f"LogEntry(entry={self._entry})"
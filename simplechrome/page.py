@@ -66,6 +66,8 @@ class Page(EventEmitterS):
         "_frameManager",
         "_javascriptEnabled",
         "_keyboard",
+        "_clientSize",
+        "_clientSizeGeneration",
         "_lifecycle_emitting",
         "_log",
         "_mouse",
@@ -169,6 +171,8 @@ class Page(EventEmitterS):
         self._javascriptEnabled: bool = True
         self._lifecycle_emitting: bool = False
         self._viewport: Dict[str, Any] = {}
+        self._clientSize: Optional[Dict[str, Number]] = None
+        self._clientSizeGeneration: int = 0
 
         if screenshotTaskQueue is None:
             screenshotTaskQueue = []
@@ -191,6 +195,11 @@ class Page(EventEmitterS):
             Events.FrameManager.FrameNavigatedWithinDocument,
             lambda event: self.emit(Events.Page.FrameNavigatedWithinDocument, event),
         )
+        _fm.on(Events.FrameManager.FrameNavigated, self._invalidateClientSize)
+        _fm.on(
+            Events.FrameManager.FrameNavigatedWithinDocument,
+            self._invalidateClientSize,
+        )
 
         _nm = self._networkManager
         _nm.on(
@@ -778,6 +787,7 @@ class Page(EventEmitterS):
         """
         needsReload = await self._emulationManager.emulateViewport(viewport)
         self._viewport = viewport
+        self._invalidateClientSize()
         if needsReload:
             await self.reload()
 
@@ -787,6 +797,7 @@ class Page(EventEmitterS):
             "Browser.setWindowBounds",
             {"windowId": windowDescriptor["windowId"], "bounds": bounds},
         )
+        self._invalidateClientSize()
 
     async def setRequestInterception(self, value: bool) -> None:
         """Enable/disable request interception."""
@@ -1476,8 +1487,35 @@ class Page(EventEmitterS):
         self.emit(Events.Page.DOMContentLoaded)
 
     def _onLoadEventFired(self, event: CDPEvent) -> None:
+        self._invalidateClientSize()
         self.emit(Events.Page.Load)
 
+    async def _getClientSize(self) -> Dict[str, Number]:
+        """Return the width and height of the layout viewport, reusing the last
+        ones retrieved until navigation, load or a viewport or window change.
+
+        Only the size is kept: the scroll offsets also reported by
+        ``Page.getLayoutMetrics`` change with any scroll, including those
+        this library does not make.
+        """
+        clientSize = self._clientSize
+        if clientSize is not None:
+            return clientSize
+        generation = self._clientSizeGeneration
+        metrics = await self._client.send("Page.getLayoutMetrics")
+        layoutViewport = metrics["layoutViewport"]
+        clientSize = {
+            "width": layoutViewport["clientWidth"],
+            "height": layoutViewport["clientHeight"],
+        }
+        if generation == self._clientSizeGeneration:
+            self._clientSize = clientSize
+        return clientSize
+
+    def _invalidateClientSize(self, *args: Any) -> None:
+        self._clientSizeGeneration += 1
+        self._clientSize = None
+
     def _onExceptionThrown(self, event: CDPEvent) -> None:
         self._handleException(event.get("exceptionDetails"))
 
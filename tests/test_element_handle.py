@@ -1,7 +1,10 @@
+import math
+
 import pytest
 from grappa import should
 
-from simplechrome.errors import ElementHandleError
+from simplechrome.errors import ElementHandleError, EvaluationError
+from simplechrome.jsHandle import computeVisibleQuadArea
 from .base_test import BaseChromeTest
 
 
@@ -37,6 +40,28 @@ class TestBoundingBox(BaseChromeTest):
         await element.boundingBox() | should.be.none
 
 
+class TestComputeVisibleQuadArea:
+    def test_quad_inside_viewport(self):
+        quad = [10, 10, 60, 10, 60, 30, 10, 30]
+        computeVisibleQuadArea(quad, 100, 100) | should.be.equal.to(1000)
+
+    def test_quad_clipped_by_viewport(self):
+        quad = [-20, -20, 50, -20, 50, 40, -20, 40]
+        computeVisibleQuadArea(quad, 30, 30) | should.be.equal.to(900)
+
+    def test_quad_outside_viewport(self):
+        quad = [200, 200, 250, 200, 250, 250, 200, 250]
+        computeVisibleQuadArea(quad, 100, 100) | should.be.equal.to(0)
+
+    def test_quad_winding_does_not_matter(self):
+        quad = [10, 10, 10, 30, 60, 30, 60, 10]
+        computeVisibleQuadArea(quad, 100, 100) | should.be.equal.to(1000)
+
+    def test_rotated_quad(self):
+        quad = [50, 0, 100, 50, 50, 100, 0, 50]
+        computeVisibleQuadArea(quad, 100, 100) | should.be.equal.to(5000)
+
+
 @pytest.mark.usefixtures("test_server_url", "chrome_page")
 class TestClick(BaseChromeTest):
     @pytest.mark.asyncio
@@ -196,3 +221,40 @@ class TestQuerySelector(BaseChromeTest):
         html = await self.page.querySelector("html")
         element = await html.xpath("/div[contains(@class, 'third')]")
         element | should.be.equal.to([])
+
+    @pytest.mark.asyncio
+    async def test_element_handle_Jeval(self):
+        await self.goto_empty()
+        await self.page.setContent(
+            '<html><body><div class="second"><div class="inner">A</div></div></body></html>'  # noqa: E501
+        )
+        html = await self.page.J("html")
+        content = await html.Jeval(".inner", "(e, suffix) => e.textContent + suffix", "B")
+        content | should.be.equal.to("AB")
+
+    @pytest.mark.asyncio
+    async def test_element_handle_Jeval_not_found(self):
+        await self.goto_empty()
+        html = await self.page.J("html")
+        with pytest.raises(Exception) as cm:
+            await html.Jeval(".third", "e => e.id")
+        str(cm.value) | should.be.equal.to(
+            'Error: failed to find element matching selector ".third"'
+        )
+
+    @pytest.mark.asyncio
+    async def test_element_handle_Jeval_unserializable_result(self):
+        await self.goto_empty()
+        html = await self.page.J("html")
+        await html.Jeval("body", "e => Infinity") | should.be.equal.to(math.inf)
+        await html.Jeval("body", "e => -Infinity") | should.be.equal.to(-math.inf)
+        await html.Jeval("body", "e => NaN") | should.be.none
+        await html.Jeval("body", "e => null") | should.be.none
+
+    @pytest.mark.asyncio
+    async def test_element_handle_Jeval_page_function_throws(self):
+        await self.goto_empty()
+        html = await self.page.J("html")
+        with pytest.raises(EvaluationError) as cm:
+            await html.Jeval("body", "e => { throw new Error('boom'); }")
+        str(cm.value) | should.contain("boom")
@@ -48,6 +48,12 @@ class TestJSHandle(BaseChromeTest):
         handle2 = await handle1.getProperty("two")
         await handle2.jsonValue() | should.be.equal.to(2)
 
+    @pytest.mark.asyncio
+    async def test_get_property_value(self):
+        await self.goto_empty()
+        handle = await self.page.evaluateHandle("() => ({one: 1, two: 2, three: 3})")
+        await handle.getPropertyValue("three") | should.be.equal.to(3)
+
     @pytest.mark.asyncio
     async def test_json_value(self):
         await self.goto_empty()
@@ -1,12 +1,25 @@
+import asyncio
 import os
+from tempfile import gettempdir
 
 import psutil
 import pytest
 from async_timeout import timeout
 from grappa import should
 
-from simplechrome.errors import NetworkError
-from simplechrome.launcher import Launcher, launch
+from simplechrome.errors import LauncherError, NetworkError
+from simplechrome import launcher
+from simplechrome.launcher import (
+    BrowserPool,
+    DEVTOOLS_LISTENING,
+    Launcher,
+    USER_DATA_DIR_PREFIX,
+    default_args,
+    default_switches,
+    launch,
+    make_user_data_dir,
+    wait_for_ws_endpoint,
+)
 
 
 class TestLauncher:
@@ -75,3 +88,188 @@ class TestLauncher:
     async def test_invalid_executable_path(self):
         with pytest.raises(FileNotFoundError):
             await launch(executablePath="not-a-path")
+
+
+class TestBrowserPool:
+    @pytest.mark.asyncio
+    async def test_recycles_browsers(self):
+        if os.environ.get("INTRAVIS", None) is not None:
+            pool = BrowserPool(
+                size=1,
+                recycleAfter=2,
+                headless=False,
+                executablePath="google-chrome-beta",
+            )
+        else:
+            pool = BrowserPool(size=1, recycleAfter=2)
+        try:
+            async with pool.acquire() as context:
+                first = context.browser()
+                page = await context.newPage()
+                await page.evaluate("() => 1 + 2") | should.be.equal.to(3)
+            async with pool.acquire() as context:
+                context.browser() | should.be.equal.to(first)
+            async with pool.acquire() as context:
+                context.browser() | should.not_be.equal.to(first)
+            pool.stats()["recycled"] | should.be.equal.to(1)
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_close_wakes_waiting_checkouts(self, monkeypatch):
+        # no browser is ever launched so the checkouts wait until close
+        monkeypatch.setattr(BrowserPool, "_launchBrowser", lambda self: None)
+        pool = BrowserPool(size=1)
+        waiters = [asyncio.ensure_future(pool.checkout()) for _ in range(2)]
+        await asyncio.sleep(0)
+        await pool.close()
+        async with timeout(5) as to:
+            results = await asyncio.gather(*waiters, return_exceptions=True)
+        to.expired | should.be.false
+        for result in results:
+            result | should.be.a(LauncherError)
+        with pytest.raises(LauncherError):
+            await pool.checkout()
+
+
+def fed_reader(data: bytes, limit: int = 2 ** 16) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader(limit=limit, loop=asyncio.get_event_loop())
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+class TestWaitForWSEndpoint:
+    @pytest.mark.asyncio
+    async def test_finds_endpoint(self):
+        reader = fed_reader(
+            b"[0101/000000.000:ERROR:gpu] noise\n"
+            + DEVTOOLS_LISTENING
+            + b"ws://127.0.0.1:9222/devtools/browser/abc\n"
+        )
+        endpoint = await wait_for_ws_endpoint(reader)
+        endpoint | should.be.equal.to("ws://127.0.0.1:9222/devtools/browser/abc")
+
+    @pytest.mark.asyncio
+    async def test_strips_crlf(self):
+        reader = fed_reader(
+            DEVTOOLS_LISTENING + b"ws://127.0.0.1:9222/devtools/browser/abc\r\n"
+        )
+        endpoint = await wait_for_ws_endpoint(reader)
+        endpoint | should.be.equal.to("ws://127.0.0.1:9222/devtools/browser/abc")
+
+    @pytest.mark.asyncio
+    async def test_skips_output_larger_than_the_limit(self):
+        reader = fed_reader(
+            b"x" * 1024
+            + b"\n"
+            + DEVTOOLS_LISTENING
+            + b"ws://127.0.0.1:9222/devtools/browser/abc\n",
+            limit=64,
+        )
+        endpoint = await wait_for_ws_endpoint(reader)
+        endpoint | should.be.equal.to("ws://127.0.0.1:9222/devtools/browser/abc")
+
+    @pytest.mark.asyncio
+    async def test_eof_before_endpoint_returns_none(self):
+        reader = fed_reader(b"chrome crashed before listening\n")
+        endpoint = await wait_for_ws_endpoint(reader)
+        endpoint | should.be.none
+
+    @pytest.mark.asyncio
+    async def test_eof_mid_endpoint_returns_none(self):
+        reader = fed_reader(DEVTOOLS_LISTENING + b"ws://127.0.0.1:92")
+        endpoint = await wait_for_ws_endpoint(reader)
+        endpoint | should.be.none
+
+
+class TestLauncherArgs:
+    def test_default_switches_headless(self):
+        switches = default_switches(None, False, True, False)
+        switches | should.be.a(tuple)
+        switches | should.contain("--headless")
+        switches | should.contain("--hide-scrollbars")
+        switches | should.do_not.contain("--auto-open-devtools-for-tabs")
+
+    def test_default_switches_devtools(self):
+        switches = default_switches("/tmp/udata", True, False, False)
+        switches | should.contain("--auto-open-devtools-for-tabs")
+        switches | should.contain("--user-data-dir=/tmp/udata")
+        switches | should.do_not.contain("--headless")
+
+    def test_default_args_appends_user_args(self):
+        args = default_args({"args": ["--foo"]})
+        args[-1] | should.be.equal.to("--foo")
+        args | should.contain("--headless")
+        args | should.have.length.of(
+            len(default_switches(None, False, True, False)) + 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_build_args_adds_missing_switches(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(launcher, "make_user_data_dir", lambda: str(tmp_path))
+        args = await Launcher().build_args(
+            {"executablePath": "chrome"}, asyncio.get_event_loop()
+        )
+        args[0] | should.be.equal.to("chrome")
+        args | should.contain("--remote-debugging-port=0")
+        args | should.contain(f"--user-data-dir={tmp_path}")
+        args | should.contain("--password-store=basic")
+        args | should.contain("--use-mock-keychain")
+        args[-1] | should.be.equal.to("about:blank")
+
+    @pytest.mark.asyncio
+    async def test_build_args_keeps_user_switches(self, monkeypatch):
+        def fail():
+            raise AssertionError("a temporary user data dir was created")
+
+        monkeypatch.setattr(launcher, "make_user_data_dir", fail)
+        args = await Launcher().build_args(
+            {
+                "executablePath": "chrome",
+                "ignoreDefaultArgs": True,
+                "args": [
+                    "--remote-debugging-pipe",
+                    "--user-data-dir=/tmp/udata",
+                    "--password-store=gnome",
+                    "https://example.com",
+                ],
+            },
+            asyncio.get_event_loop(),
+        )
+        args | should.be.equal.to(
+            [
+                "chrome",
+                "--remote-debugging-pipe",
+                "--user-data-dir=/tmp/udata",
+                "--password-store=gnome",
+                "https://example.com",
+            ]
+        )
+
+    def test_make_user_data_dir_prefers_shm(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(launcher, "SHM_DIR", str(tmp_path))
+        monkeypatch.setattr(launcher, "SHM_MIN_FREE", 0)
+        udata = make_user_data_dir()
+        try:
+            os.path.dirname(udata) | should.be.equal.to(str(tmp_path))
+            os.path.basename(udata) | should.start_with(USER_DATA_DIR_PREFIX)
+        finally:
+            os.rmdir(udata)
+
+    def test_make_user_data_dir_falls_back_to_tempdir(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(launcher, "SHM_DIR", str(tmp_path / "missing"))
+        udata = make_user_data_dir()
+        try:
+            os.path.dirname(udata) | should.be.equal.to(gettempdir())
+        finally:
+            os.rmdir(udata)
+
+    def test_make_user_data_dir_skips_full_shm(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(launcher, "SHM_DIR", str(tmp_path))
+        monkeypatch.setattr(launcher, "SHM_MIN_FREE", 2 ** 62)
+        udata = make_user_data_dir()
+        try:
+            os.path.dirname(udata) | should.be.equal.to(gettempdir())
+        finally:
+            os.rmdir(udata)
@@ -0,0 +1,28 @@
+import pytest
+from grappa import should
+
+from simplechrome.lifecycle_watcher import resolve_expected_lifecycle
+
+
+class TestResolveExpectedLifecycle:
+    def test_maps_wait_until_to_protocol_events(self):
+        expected = resolve_expected_lifecycle(("documentloaded", "load"))
+        expected | should.be.equal.to(frozenset({"DOMContentLoaded", "load"}))
+
+    def test_network_idle_values(self):
+        resolve_expected_lifecycle(("networkidle0",)) | should.be.equal.to(
+            frozenset({"networkIdle"})
+        )
+        resolve_expected_lifecycle(("networkidle2",)) | should.be.equal.to(
+            frozenset({"networkAlmostIdle"})
+        )
+
+    def test_results_are_cached(self):
+        first = resolve_expected_lifecycle(("load",))
+        resolve_expected_lifecycle(("load",)) | should.be.equal.to(first)
+        (resolve_expected_lifecycle(("load",)) is first) | should.be.true
+
+    def test_unknown_value_raises(self):
+        with pytest.raises(ValueError) as info:
+            resolve_expected_lifecycle(("load", "bogus"))
+        str(info.value) | should.contain("bogus")
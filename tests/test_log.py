@@ -0,0 +1,48 @@
+from grappa import should
+
+from simplechrome.log import LogEntry
+
+
+def make_entry(**kwargs) -> LogEntry:
+    entry = {"source": "javascript", "level": "error", "text": "boom"}
+    entry.update(kwargs)
+    return LogEntry(entry)
+
+
+class TestLogEntryLocation:
+    def test_location_from_first_call_frame(self):
+        entry = make_entry(
+            stackTrace={
+                "callFrames": [
+                    {
+                        "functionName": "inner",
+                        "url": "http://localhost/a.js",
+                        "lineNumber": 10,
+                        "columnNumber": 4,
+                    },
+                    {
+                        "functionName": "outer",
+                        "url": "http://localhost/b.js",
+                        "lineNumber": 1,
+                        "columnNumber": 0,
+                    },
+                ]
+            }
+        )
+        entry.location | should.be.equal.to(
+            {"url": "http://localhost/a.js", "lineNumber": 10, "columnNumber": 4}
+        )
+
+    def test_location_is_resolved_once(self):
+        entry = make_entry(
+            stackTrace={
+                "callFrames": [{"url": "a.js", "lineNumber": 1, "columnNumber": 2}]
+            }
+        )
+        (entry.location is entry.location) | should.be.true
+
+    def test_no_stack_trace(self):
+        make_entry().location | should.be.none
+
+    def test_empty_call_frames(self):
+        make_entry(stackTrace={"callFrames": []}).location | should.be.none